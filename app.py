@@ -5,15 +5,25 @@ import base64
 from pathlib import Path
 import pandas as pd
 import json
+import orjson
+import csv
 import zipfile
 from docx import Document
 from docx.shared import Inches
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls, qn
 import fitz  # PyMuPDF - Better PDF processing
 from pdf2image import convert_from_bytes
 import img2pdf
 from pptx import Presentation
 from pptx.util import Inches as PptxInches
+from pptx.shapes.picture import Picture
+from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 import openpyxl
+from python_calamine import CalamineWorkbook
+import xlsxwriter
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 from reportlab.lib.pagesizes import letter, landscape
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image as RLImage, Table, TableStyle, PageBreak
 from reportlab.pdfgen import canvas as pdfcanvas
@@ -22,12 +32,23 @@ from reportlab.lib.units import inch
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT, TA_JUSTIFY
 from reportlab.lib.utils import ImageReader
+from reportlab.pdfbase.pdfmetrics import stringWidth
 from xml.sax.saxutils import escape
 import logging
+import functools
+import hashlib
+from itertools import groupby, islice
 import traceback
 import tempfile
 import os
 import sys
+import gc
+import subprocess
+import platform
+from types import MappingProxyType
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 # Configure logging for production
 logging.basicConfig(
@@ -51,6 +72,7 @@ st.set_page_config(
 # Production-ready error handling decorator
 def handle_conversion_errors(func):
     """Decorator for handling conversion errors gracefully"""
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
         try:
             logger.info(f"Starting conversion: {func.__name__}")
@@ -67,13 +89,18 @@ def handle_conversion_errors(func):
             return None
     return wrapper
 
+# Memoize conversions across Streamlit reruns, keyed on the uploaded bytes and parameters
+cache_conversion = st.cache_data(max_entries=8, ttl=600, show_spinner=False)
+# Image conversions run once per file in a batch upload, so they need room for a whole batch
+cache_image_conversion = st.cache_data(max_entries=32, ttl=600, show_spinner=False)
+
 # File size validation
 def validate_file_size(uploaded_file, max_size_mb=50):
     """Validate file size before processing"""
     if uploaded_file is None:
         return False
     
-    file_size = len(uploaded_file.getvalue())
+    file_size = uploaded_file.size  # recorded by Streamlit at upload, no buffer access needed
     max_size_bytes = max_size_mb * 1024 * 1024
     
     if file_size > max_size_bytes:
@@ -84,9 +111,152 @@ def validate_file_size(uploaded_file, max_size_mb=50):
 # Memory management helper
 def clear_memory():
     """Clear memory after heavy operations"""
-    import gc
     gc.collect()
 
+# Shared ReportLab styles, built once instead of on every conversion
+STYLES = getSampleStyleSheet()
+for level in range(1, 10):
+    if f'Heading{level}' not in STYLES:
+        STYLES.add(ParagraphStyle(
+            name=f'Heading{level}',
+            parent=STYLES['Heading1'],
+            fontSize=max(12, 20 - (level * 2)),
+            spaceAfter=12,
+            spaceBefore=12,
+            textColor=colors.darkblue
+        ))
+
+# Word heading style names ("Heading 1" or "Heading1") mapped to their PDF style
+HEADING_STYLES = {}
+for level in range(1, 10):
+    HEADING_STYLES[f'Heading {level}'] = STYLES[f'Heading{level}']
+    HEADING_STYLES[f'Heading{level}'] = STYLES[f'Heading{level}']
+
+# Sheet table style for Excel to PDF; the header colour is parsed once, not per sheet
+EXCEL_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#4472C4')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+])
+
+# Word document tables in Word to PDF
+WORD_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.lightblue),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('LEFTPADDING', (0, 0), (-1, -1), 6),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 6),
+])
+
+# Slide tables in the PowerPoint high-fidelity (canvas) and story renderers
+SLIDE_CANVAS_TABLE_STYLE = TableStyle([
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+    ('FONT', (0, 0), (-1, -1), 'Helvetica', 12),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+])
+
+SLIDE_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.lightblue),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
+    ('LEFTPADDING', (0, 0), (-1, -1), 6),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 6),
+    ('TOPPADDING', (0, 0), (-1, -1), 4),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
+])
+
+# Paragraph styles for the PowerPoint story renderer
+SLIDE_TITLE_STYLE = ParagraphStyle(
+    'SlideTitle',
+    parent=STYLES['Heading1'],
+    fontSize=20,
+    spaceAfter=16,
+    spaceBefore=8,
+    alignment=TA_CENTER,
+    textColor=colors.darkblue,
+    fontName='Helvetica-Bold',
+    leading=24  # Improved line spacing
+)
+
+SLIDE_CONTENT_TITLE_STYLE = ParagraphStyle(
+    'ContentTitle',
+    parent=STYLES['Heading2'],
+    fontSize=16,
+    spaceAfter=10,
+    spaceBefore=8,
+    alignment=TA_LEFT,
+    textColor=colors.darkblue,
+    fontName='Helvetica-Bold',
+    leading=20  # Improved line spacing
+)
+
+SLIDE_CONTENT_STYLE = ParagraphStyle(
+    'SlideContent',
+    parent=STYLES['Normal'],
+    fontSize=12,
+    spaceAfter=10,
+    spaceBefore=4,
+    alignment=TA_LEFT,
+    leading=16,  # Improved line spacing
+    fontName='Helvetica'
+)
+
+SLIDE_BULLET_STYLE = ParagraphStyle(
+    'BulletStyle',
+    parent=SLIDE_CONTENT_STYLE,
+    leftIndent=30,
+    bulletIndent=15,
+    spaceAfter=8,
+    bulletFontName='Symbol',
+    bulletText='•',
+    leading=16  # Improved line spacing
+)
+
+# Bullet styles per PowerPoint outline level (0-8), indented 15pt per level
+SLIDE_BULLET_LEVEL_STYLES = tuple(
+    ParagraphStyle(
+        f'BulletLevel{level}',
+        parent=SLIDE_BULLET_STYLE,
+        leftIndent=30 + (level * 15),
+        bulletIndent=15 + (level * 15)
+    )
+    for level in range(9)
+)
+
+# Leading characters that mark a slide paragraph as a typed bullet
+SLIDE_BULLET_CHARS = frozenset('•-*◦▪▫')
+
+# Most lines of a text block put into one Paragraph by Text to PDF
+TEXT_PARAGRAPH_MAX_LINES = 50
+
+# Resampling filters offered by Resize Image, sharpest (and slowest) first
+RESAMPLING_FILTERS = MappingProxyType({
+    "Lanczos": Image.Resampling.LANCZOS,
+    "Bicubic": Image.Resampling.BICUBIC,
+    "Bilinear": Image.Resampling.BILINEAR,
+})
+
+# Minimum decode size for upload previews: st.image never shows more than 1460 px of width,
+# and the height follows the aspect ratio, so only the width needs to be kept
+PREVIEW_DRAFT_SIZE = (1460, 1)
+
+# Largest worksheet Excel can open
+EXCEL_MAX_ROWS = 1048576
+EXCEL_MAX_COLS = 16384
+
 # Custom CSS with improved styling
 st.markdown("""
 <style>
@@ -151,17 +321,17 @@ st.markdown("""
 # Title with improved styling
 st.markdown('<div class="main-header"><h1>🔄 Universal File Converter Pro</h1><p>Convert any file format with ease - Production Ready</p></div>', unsafe_allow_html=True)
 
-# Conversion categories
-conversion_categories = {
-    "📄 To PDF": [
+# Conversion categories (read-only)
+conversion_categories = MappingProxyType({
+    "📄 To PDF": (
         "Word to PDF",
         "Excel to PDF", 
         "PowerPoint to PDF",
         "JPG to PDF",
         "PNG to PDF",
         "Text to PDF"
-    ],
-    "📝 From PDF": [
+    ),
+    "📝 From PDF": (
         "PDF to Word",
         "PDF to Excel",
         "PDF to PowerPoint",
@@ -169,16 +339,16 @@ conversion_categories = {
         "PDF to PNG",
         "Extract PDF Images",
         "PDF to Text"
-    ],
-    "🛠️ PDF Tools": [
+    ),
+    "🛠️ PDF Tools": (
         "Merge PDF",
         "Split PDF",
         "Compress PDF",
         "Rotate PDF",
         "Remove PDF Pages",
         "Extract PDF Pages"
-    ],
-    "🖼️ Image Conversion": [
+    ),
+    "🖼️ Image Conversion": (
         "JPG to PNG",
         "PNG to JPG",
         "Image to WebP",
@@ -188,24 +358,107 @@ conversion_categories = {
         "BMP to JPG",
         "Resize Image",
         "Rotate Image"
-    ],
-    "📊 Office Files": [
+    ),
+    "📊 Office Files": (
         "Word to Excel",
         "Excel to Word",
         "CSV to Excel",
         "Excel to CSV",
         "JSON to Excel",
         "Excel to JSON"
-    ]
-}
+    )
+})
 
 # Sidebar
 st.sidebar.header("🎯 Select Conversion Type")
-category = st.sidebar.selectbox("Category", list(conversion_categories.keys()))
+category = st.sidebar.selectbox("Category", tuple(conversion_categories))
 conversion_type = st.sidebar.selectbox("Conversion", conversion_categories[category])
 
 # Helper Functions
 
+def paragraph_to_markup(para, max_length):
+    """Build ReportLab markup for a Word paragraph, keeping bold and italic runs"""
+    parts = []
+    plain_length = 0
+    for run in para.runs:
+        run_text = run.text[:max_length - plain_length]
+        plain_length += len(run.text)
+        if run_text:
+            run_markup = escape(run_text)
+            if run.bold:
+                run_markup = f'<b>{run_markup}</b>'
+            if run.italic:
+                run_markup = f'<i>{run_markup}</i>'
+            parts.append(run_markup)
+        if plain_length >= max_length:
+            break
+    
+    # Runs don't cover all paragraph content (e.g. hyperlinks); fall back to plain text
+    if plain_length < min(len(para.text), max_length):
+        return escape(para.text[:max_length])
+    return ''.join(parts)
+
+def docx_run_text(text):
+    """Escape text for a <w:t> element, turning tabs and line breaks into their WordprocessingML tags"""
+    text = escape(text)
+    text = text.replace('\t', '</w:t><w:tab/><w:t xml:space="preserve">')
+    for line_break in ('\r\n', '\r', '\n'):
+        text = text.replace(line_break, '</w:t><w:br/><w:t xml:space="preserve">')
+    return text
+
+def docx_table_texts(table):
+    """Cell texts of a Word table, read straight from the table XML.
+    
+    Laid out like [[cell.text for cell in row.cells] for row in table.rows] (a cell
+    spanning several grid columns is repeated, a vertically merged cell repeats the
+    text above it), without python-docx rebuilding cell proxies and the cell grid
+    for every row. Only <w:t>, <w:tab> and <w:br> are read, so the text can differ
+    from python-docx's: every <w:br> becomes a newline, <w:cr> and <w:noBreakHyphen>
+    are dropped, and tracked insertions (<w:ins>) are included.
+    """
+    text_tag, tab_tag, br_tag = qn('w:t'), qn('w:tab'), qn('w:br')
+    
+    def paragraph_text(p):
+        return ''.join(el.text or '' if el.tag == text_tag else '\t' if el.tag == tab_tag else '\n'
+                       for el in p.iter(text_tag, tab_tag, br_tag))
+    
+    rows = []
+    previous_row = []
+    for tr in table._tbl.iterchildren(qn('w:tr')):
+        row_data = []
+        for tc in tr.iterchildren(qn('w:tc')):
+            grid_col = len(row_data)
+            if tc.vMerge == 'continue' and grid_col < len(previous_row):
+                cell_text = previous_row[grid_col]
+            else:
+                cell_text = '\n'.join(paragraph_text(p) for p in tc.iterchildren(qn('w:p')))
+            row_data.extend([cell_text] * tc.grid_span)
+        rows.append(row_data)
+        previous_row = row_data
+    return rows
+
+def docx_table_rows(table, max_length):
+    """Escaped cell texts of a Word table, cut to max_length, for ReportLab Paragraphs"""
+    return [[escape(cell_text[:max_length]) for cell_text in row] for row in docx_table_texts(table)]
+
+def table_column_widths(data, font_size=10, padding=12):
+    """Natural column widths of a string Table in EXCEL_TABLE_STYLE, as ReportLab would size them.
+    
+    Lets a long sheet be laid out as several Tables that still line up, without
+    wrapping the whole sheet once just to read the widths back.
+    """
+    widths = []
+    for row_num, row in enumerate(data):
+        font_name = 'Helvetica-Bold' if row_num == 0 else 'Helvetica'
+        for col_num, value in enumerate(row):
+            width = max(stringWidth(line, font_name, font_size) for line in value.split('\n')) + padding
+            if col_num == len(widths):
+                widths.append(width)
+            elif width > widths[col_num]:
+                widths[col_num] = width
+    return widths
+
+@cache_conversion
 @handle_conversion_errors
 def word_to_pdf(uploaded_file):
     """Convert Word to PDF with enhanced error handling and formatting preservation"""
@@ -220,21 +473,12 @@ def word_to_pdf(uploaded_file):
                                    leftMargin=inch, rightMargin=inch,
                                    topMargin=inch, bottomMargin=inch)
         
-        styles = getSampleStyleSheet()
+        styles = STYLES
         story = []
         
-        # Create enhanced custom styles
-        for i in range(1, 10):
-            style_name = f'Heading{i}'
-            if style_name not in styles:
-                styles.add(ParagraphStyle(
-                    name=style_name,
-                    parent=styles['Heading1'],
-                    fontSize=max(12, 20 - (i * 2)),
-                    spaceAfter=12,
-                    spaceBefore=12,
-                    textColor=colors.darkblue
-                ))
+        # PDF style per Word style id; para.style searches the document's styles part
+        # on every access, so each distinct style is resolved only once
+        pdf_styles = {}
         
         # Process paragraphs with enhanced error handling
         for para in doc.paragraphs:
@@ -242,23 +486,21 @@ def word_to_pdf(uploaded_file):
                 story.append(Spacer(1, 6))
                 continue
             
-            style = styles['Normal']
-            
-            # Enhanced paragraph style detection with proper null checks
-            if para.style and hasattr(para.style, 'name') and para.style.name and para.style.name.startswith('Heading'):
-                try:
-                    level = para.style.name.replace('Heading', '').strip()
-                    if level.isdigit() and int(level) <= 9:
-                        style = styles[f'Heading{level}']
-                    else:
-                        style = styles['Heading1']
-                except (ValueError, KeyError, AttributeError):
-                    style = styles['Heading1']
-            elif para.style and hasattr(para.style, 'name') and para.style.name and 'Title' in para.style.name:
-                style = styles['Title']
+            style_id = para._p.style
+            if style_id not in pdf_styles:
+                style = styles['Normal']
+                
+                # Enhanced paragraph style detection with proper null checks
+                style_name = getattr(para.style, 'name', None) if para.style else None
+                if style_name and style_name.startswith('Heading'):
+                    style = HEADING_STYLES.get(style_name, styles['Heading1'])
+                elif style_name and 'Title' in style_name:
+                    style = styles['Title']
+                pdf_styles[style_id] = style
+            style = pdf_styles[style_id]
             
             # Escape special characters and limit text length
-            text = escape(para.text[:2000])  # Limit text length
+            text = paragraph_to_markup(para, 2000)  # Limit text length
             if text.strip():
                 p = Paragraph(text, style)
                 story.append(p)
@@ -267,13 +509,7 @@ def word_to_pdf(uploaded_file):
         # Process tables with enhanced formatting
         for table in doc.tables:
             try:
-                data = []
-                for row in table.rows:
-                    row_data = []
-                    for cell in row.cells:
-                        cell_text = escape(cell.text[:500])  # Limit cell text
-                        row_data.append(cell_text)
-                    data.append(row_data)
+                data = docx_table_rows(table, 500)  # Limit cell text
                 
                 if data and any(any(cell.strip() for cell in row) for row in data):
                     # Calculate column widths
@@ -282,18 +518,7 @@ def word_to_pdf(uploaded_file):
                     col_widths = [available_width / col_count] * col_count
                     
                     t = Table(data, colWidths=col_widths, repeatRows=1)
-                    t.setStyle(TableStyle([
-                        ('BACKGROUND', (0, 0), (-1, 0), colors.lightblue),
-                        ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
-                        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                        ('FONTSIZE', (0, 0), (-1, -1), 10),
-                        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                        ('LEFTPADDING', (0, 0), (-1, -1), 6),
-                        ('RIGHTPADDING', (0, 0), (-1, -1), 6),
-                    ]))
+                    t.setStyle(WORD_TABLE_STYLE)
                     story.append(t)
                     story.append(Spacer(1, 12))
             except Exception as table_error:
@@ -310,6 +535,11 @@ def word_to_pdf(uploaded_file):
             pdf_doc.build(story)
         except Exception as build_error:
             logger.warning(f"Complex layout failed: {build_error}")
+            
+            # Reset output buffer
+            output.seek(0)
+            output.truncate(0)
+            
             # Create simplified version
             simple_story = [
                 Paragraph("Document Content", styles['Title']),
@@ -332,39 +562,42 @@ def word_to_pdf(uploaded_file):
         logger.error(f"Word to PDF conversion error: {str(e)}")
         raise e
 
+@cache_conversion
 def excel_to_pdf(uploaded_file):
     """Convert Excel to PDF"""
     try:
-        wb = openpyxl.load_workbook(uploaded_file)
+        # Stream cell values instead of building the full styled workbook in memory
+        wb = openpyxl.load_workbook(uploaded_file, read_only=True, data_only=True)
         
         output = io.BytesIO()
         pdf_doc = SimpleDocTemplate(output, pagesize=letter)
-        styles = getSampleStyleSheet()
+        styles = STYLES
         story = []
         
         for sheet_name in wb.sheetnames:
             ws = wb[sheet_name]
+            # Read-only mode trusts the sheet's stored <dimension>, which other tools
+            # often leave stale (e.g. "A1"); rescan so no columns are dropped
+            ws.reset_dimensions()
             
             story.append(Paragraph(f"<b>Sheet: {sheet_name}</b>", styles['Heading1']))
             story.append(Spacer(1, 12))
             
-            data = []
-            for row in ws.iter_rows():
-                row_data = [str(cell.value if cell.value is not None else "") for cell in row]
-                data.append(row_data)
+            data = [["" if value is None else str(value) for value in row]
+                    for row in ws.values]
             
             if data:
-                t = Table(data, repeatRows=1)
-                t.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#4472C4')),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-                ]))
-                story.append(t)
+                # ReportLab re-measures the rest of a table at every page split, which is
+                # quadratic in its rows; lay long sheets out as 200-row tables instead
+                col_widths = table_column_widths(data)
+                header, body = data[0], data[1:]
+                for start in range(0, max(len(body), 1), 200):
+                    t = Table([header] + body[start:start + 200], colWidths=col_widths, repeatRows=1)
+                    t.setStyle(EXCEL_TABLE_STYLE)
+                    story.append(t)
                 story.append(Spacer(1, 24))
         
+        wb.close()
         pdf_doc.build(story)
         output.seek(0)
         return output
@@ -372,30 +605,80 @@ def excel_to_pdf(uploaded_file):
         st.error(f"Error: {str(e)}")
         return None
 
+def slide_picture_flowables(image_bytes, max_width, max_height):
+    """Story flowables for a slide picture scaled to fit max_width x max_height points.
+    
+    Works only on the picture's bytes, so it can run on a worker thread while the
+    main thread keeps walking the (not thread-safe) python-pptx shape tree.
+    """
+    try:
+        # Create PIL Image
+        img_buffer = io.BytesIO(image_bytes)
+        pil_image = Image.open(img_buffer)
+        
+        # Preserve aspect ratio
+        width, height = pil_image.size
+        aspect = width / height if height > 0 else 1
+        
+        if width > max_width:
+            width = max_width
+            height = width / aspect
+        
+        if height > max_height:
+            height = max_height
+            width = height * aspect
+        
+        # Ensure dimensions are valid
+        width = max(1, int(width))
+        height = max(1, int(height))
+        
+        if pil_image.format == 'JPEG' and pil_image.mode in ('L', 'RGB') and (width, height) == pil_image.size:
+            # Already a JPEG that fits: ReportLab embeds it as-is, no decode or re-encode
+            img_buffer = io.BytesIO(image_bytes)
+        else:
+            # Let libjpeg decode oversized JPEGs at a reduced DCT scale before resampling
+            pil_image.draft(pil_image.mode, (width, height))
+            
+            # Resize image with high quality; reducing_gap box-reduces large
+            # sources first so the filter runs near the target size
+            try:
+                pil_image = pil_image.resize((width, height), Image.Resampling.LANCZOS, reducing_gap=2.0)
+            except:
+                # Fallback to BICUBIC if LANCZOS fails
+                pil_image = pil_image.resize((width, height), Image.BICUBIC, reducing_gap=2.0)
+            
+            # Convert to RGB if necessary
+            if pil_image.mode in ('RGBA', 'LA', 'P'):
+                pil_image = pil_image.convert('RGB')
+            
+            # Save to BytesIO; q80 progressive is indistinguishable at slide size
+            img_buffer = io.BytesIO()
+            pil_image.save(img_buffer, format='JPEG', quality=80, optimize=True, progressive=True)
+            img_buffer.seek(0)
+        
+        # Create ReportLab image with proper alignment and preserve formatting
+        rl_image = RLImage(img_buffer, width=width, height=height)
+        # Center the image for better formatting
+        rl_image.hAlign = 'CENTER'
+        return [rl_image, Spacer(1, 16)]
+    except Exception:
+        # If image extraction fails, add a placeholder
+        return [Paragraph("[Image could not be extracted]", SLIDE_CONTENT_STYLE), Spacer(1, 8)]
+
+@cache_conversion
 def ppt_to_pdf(uploaded_file):
     """Convert PowerPoint to PDF using a direct approach that preserves formatting"""
     try:
         # Validate file size
-        file_content = uploaded_file.read()
-        if len(file_content) > 50 * 1024 * 1024:  # 50MB limit
+        if uploaded_file.size > 50 * 1024 * 1024:  # 50MB limit
             raise ValueError("File size too large. Please upload a file smaller than 50MB.")
         
-        # Reset file pointer
-        uploaded_file.seek(0)
-        
-        # Create a temporary directory to work with the files
-        import tempfile
-        import os
-        import subprocess
-        import platform
-        from pathlib import Path
-        
         # Create a temporary directory
         with tempfile.TemporaryDirectory() as temp_dir:
             # Save the PowerPoint file to the temporary directory
             temp_ppt_path = os.path.join(temp_dir, "presentation.pptx")
             with open(temp_ppt_path, "wb") as f:
-                f.write(file_content)
+                f.write(uploaded_file.getvalue())
             
             # Create output PDF path
             temp_pdf_path = os.path.join(temp_dir, "output.pdf")
@@ -468,7 +751,6 @@ def ppt_to_pdf(uploaded_file):
                         # Force garbage collection to release COM objects
                         del presentation
                         del powerpoint
-                        import gc
                         gc.collect()
                         
                         # Check if PDF was created
@@ -557,7 +839,7 @@ def ppt_to_pdf(uploaded_file):
                             if layout is not None:
                                 for shp in getattr(layout, 'shapes', []):
                                     try:
-                                        if hasattr(shp, 'image') and shp.image is not None:
+                                        if isinstance(shp, Picture):
                                             pil_img = Image.open(io.BytesIO(shp.image.blob))
                                             # Draw stretched as background (layout images often intended as full-bleed)
                                             c.drawImage(ImageReader(pil_img), 0, 0, width=page_width_pt, height=page_height_pt)
@@ -570,7 +852,7 @@ def ppt_to_pdf(uploaded_file):
                             if master is not None:
                                 for shp in getattr(master, 'shapes', []):
                                     try:
-                                        if hasattr(shp, 'image') and shp.image is not None:
+                                        if isinstance(shp, Picture):
                                             pil_img = Image.open(io.BytesIO(shp.image.blob))
                                             c.drawImage(ImageReader(pil_img), 0, 0, width=page_width_pt, height=page_height_pt)
                                             return
@@ -610,12 +892,12 @@ def ppt_to_pdf(uploaded_file):
                                 bottom_y = page_height_pt - y_pt_top - h_pt
 
                                 # Draw pictures
-                                if hasattr(shape, 'image') and shape.image is not None:
+                                if isinstance(shape, Picture):
                                     try:
-                                        img_blob = shape.image.blob
-                                        img_stream = io.BytesIO(img_blob)
-                                        pil_img = Image.open(img_stream)
-                                        img_w, img_h = pil_img.size
+                                        # One reader serves both the size probe and the draw;
+                                        # ReportLab embeds JPEG data without decoding it
+                                        img_reader = ImageReader(io.BytesIO(shape.image.blob))
+                                        img_w, img_h = img_reader.getSize()
                                         if img_w == 0 or img_h == 0:
                                             continue
                                         # Scale to fit bounding box preserving aspect ratio and center
@@ -624,18 +906,16 @@ def ppt_to_pdf(uploaded_file):
                                         draw_h = img_h * scale
                                         draw_x = x_pt + max(0, (w_pt - draw_w) / 2.0)
                                         draw_y = bottom_y + max(0, (h_pt - draw_h) / 2.0)
-                                        c.drawImage(ImageReader(pil_img), draw_x, draw_y, width=draw_w, height=draw_h, preserveAspectRatio=True, mask='auto')
+                                        c.drawImage(img_reader, draw_x, draw_y, width=draw_w, height=draw_h, preserveAspectRatio=True, mask='auto')
                                     except Exception:
                                         continue
 
                                 # Draw text frames
-                                elif getattr(shape, 'has_text_frame', False):
+                                elif shape.has_text_frame:
                                     try:
                                         tf = shape.text_frame
-                                        from pptx.enum.text import PP_ALIGN
                                         # Vertical anchor
                                         try:
-                                            from pptx.enum.text import MSO_ANCHOR
                                             v_anchor = getattr(tf, 'vertical_anchor', getattr(MSO_ANCHOR, 'TOP', None))
                                         except Exception:
                                             v_anchor = None
@@ -751,7 +1031,7 @@ def ppt_to_pdf(uploaded_file):
                                         continue
 
                                 # Draw tables (approximate)
-                                elif getattr(shape, 'has_table', False):
+                                elif shape.has_table:
                                     try:
                                         data = []
                                         tbl = shape.table
@@ -761,11 +1041,7 @@ def ppt_to_pdf(uploaded_file):
                                         col_count = len(data[0]) if data else 0
                                         col_widths = [w_pt / max(col_count, 1)] * max(col_count, 1)
                                         t = Table(data, colWidths=col_widths)
-                                        t.setStyle(TableStyle([
-                                            ('GRID', (0,0), (-1,-1), 0.5, colors.grey),
-                                            ('FONT', (0,0), (-1,-1), 'Helvetica', 12),
-                                            ('VALIGN', (0,0), (-1,-1), 'MIDDLE')
-                                        ]))
+                                        t.setStyle(SLIDE_CANVAS_TABLE_STYLE)
                                         tw, th = t.wrap(w_pt, h_pt)
                                         t.drawOn(c, x_pt, bottom_y + max(0, (h_pt - th)))
                                     except Exception:
@@ -807,55 +1083,13 @@ def ppt_to_pdf(uploaded_file):
             topMargin=0.5*inch,
             bottomMargin=0.5*inch
         )
-        styles = getSampleStyleSheet()
+        styles = STYLES
         story = []
         
-        # Create enhanced custom styles with better formatting
-        slide_title_style = ParagraphStyle(
-            'SlideTitle',
-            parent=styles['Heading1'],
-            fontSize=20,
-            spaceAfter=16,
-            spaceBefore=8,
-            alignment=TA_CENTER,
-            textColor=colors.darkblue,
-            fontName='Helvetica-Bold',
-            leading=24  # Improved line spacing
-        )
-        
-        content_title_style = ParagraphStyle(
-            'ContentTitle',
-            parent=styles['Heading2'],
-            fontSize=16,
-            spaceAfter=10,
-            spaceBefore=8,
-            alignment=TA_LEFT,
-            textColor=colors.darkblue,
-            fontName='Helvetica-Bold',
-            leading=20  # Improved line spacing
-        )
-        
-        content_style = ParagraphStyle(
-            'SlideContent',
-            parent=styles['Normal'],
-            fontSize=12,
-            spaceAfter=10,
-            spaceBefore=4,
-            alignment=TA_LEFT,
-            leading=16,  # Improved line spacing
-            fontName='Helvetica'
-        )
-        
-        bullet_style = ParagraphStyle(
-            'BulletStyle',
-            parent=content_style,
-            leftIndent=30,
-            bulletIndent=15,
-            spaceAfter=8,
-            bulletFontName='Symbol',
-            bulletText='•',
-            leading=16  # Improved line spacing
-        )
+        slide_title_style = SLIDE_TITLE_STYLE
+        content_title_style = SLIDE_CONTENT_TITLE_STYLE
+        content_style = SLIDE_CONTENT_STYLE
+        bullet_style = SLIDE_BULLET_STYLE
         
         # Try to extract presentation title from metadata or first slide
         presentation_title = "Photography Studios"  # Default to the filename
@@ -876,176 +1110,131 @@ def ppt_to_pdf(uploaded_file):
         
         # Limit number of slides to prevent excessive processing
         max_slides = 50  # Increased limit for better content coverage
-        slides_to_process = list(prs.slides)[:max_slides]
-        
-        for i, slide in enumerate(slides_to_process):
-            # Add slide header with better formatting
-            slide_header = f"Slide {i + 1} of {len(slides_to_process)}"
-            story.append(Paragraph(slide_header, slide_title_style))
-            story.append(Spacer(1, 16))
-            
-            # Process slide content with increased limits
-            shape_count = 0
-            max_shapes_per_slide = 30  # Increased limit for better content capture
-            slide_has_content = False
-            
-            # Try to extract slide title first
-            slide_title = None
-            try:
-                # Look for title placeholder
-                for shape in slide.shapes:
-                    if hasattr(shape, 'is_placeholder') and shape.is_placeholder and shape.placeholder_format.idx == 0:
-                        if hasattr(shape, 'text') and shape.text.strip():
-                            slide_title = shape.text.strip()
-                            break
-                    # Fallback: look for any text that looks like a title
-                    elif hasattr(shape, 'text') and shape.text.strip() and len(shape.text) < 100:
-                        if shape.text.strip() not in slide_header:  # Avoid duplicating slide number
-                            slide_title = shape.text.strip()
-                            break
-            except:
-                pass
-            
-            # Add slide title if found
-            if slide_title:
-                story.append(Paragraph(slide_title, content_title_style))
-                story.append(Spacer(1, 12))
-                slide_has_content = True
-            
-            # Sort shapes by their position (top to bottom, left to right)
-            try:
-                sorted_shapes = sorted(slide.shapes, key=lambda s: (s.top, s.left) if hasattr(s, 'top') and hasattr(s, 'left') else (0, 0))
-            except:
-                sorted_shapes = slide.shapes
-            
-            for shape in sorted_shapes:
-                # Skip if this is the title we already processed
-                if slide_title and hasattr(shape, 'text') and shape.text.strip() == slide_title:
-                    continue
-                    
-                shape_count += 1
-                if shape_count > max_shapes_per_slide:
-                    break
+        slides_to_process = list(islice(prs.slides, max_slides))
+        slide_count = len(slides_to_process)
+        
+        # Pictures are independent byte blobs, so their PIL work runs on threads
+        # (Pillow releases the GIL in its codecs and resamplers)
+        picture_max_width = min(pdf_doc.width * 0.8, 500)  # 80% of page width or 500pt max
+        picture_max_height = min(pdf_doc.height * 0.6, 400)  # 60% of page height or 400pt max
+        with ThreadPoolExecutor(max_workers=max(1, (os.cpu_count() or 2) - 1)) as picture_executor:
+            for i, slide in enumerate(slides_to_process):
+                # Add slide header with better formatting
+                slide_header = f"Slide {i + 1} of {slide_count}"
+                story.append(Paragraph(slide_header, slide_title_style))
+                story.append(Spacer(1, 16))
+                
+                # Process slide content with increased limits
+                shape_count = 0
+                max_shapes_per_slide = 30  # Increased limit for better content capture
+                slide_has_content = False
+                
+                # Try to extract slide title first
+                slide_title = None
+                
+                # Walk the shape tree once; python-pptx builds new proxies and re-reads the
+                # text XML on every pass, so each shape's text is read here and reused below
+                shape_entries = [(shape, getattr(shape, 'text', '').strip()) for shape in slide.shapes]
                 
                 try:
-                    # Handle images with improved quality
-                    if hasattr(shape, 'shape_type') and shape.shape_type == 13:  # Picture type
-                        try:
-                            # Extract image from shape
-                            image = shape.image
-                            image_bytes = image.blob
-                            
-                            # Create PIL Image
-                            img_buffer = io.BytesIO(image_bytes)
-                            pil_image = Image.open(img_buffer)
-                            
-                            # Calculate better image size based on PDF dimensions
-                            max_width = min(pdf_doc.width * 0.8, 500)  # 80% of page width or 500pt max
-                            max_height = min(pdf_doc.height * 0.6, 400)  # 60% of page height or 400pt max
-                            
-                            # Preserve aspect ratio
-                            width, height = pil_image.size
-                            aspect = width / height if height > 0 else 1
-                            
-                            if width > max_width:
-                                width = max_width
-                                height = width / aspect
-                            
-                            if height > max_height:
-                                height = max_height
-                                width = height * aspect
-                            
-                            # Ensure dimensions are valid
-                            width = max(1, int(width))
-                            height = max(1, int(height))
-                            
-                            # Resize image with high quality
+                    # Look for title placeholder
+                    for shape, shape_text in shape_entries:
+                        if shape.is_placeholder and shape.placeholder_format.idx == 0:
+                            if shape_text:
+                                slide_title = shape_text
+                                break
+                        # Fallback: look for any text that looks like a title
+                        elif shape_text and len(shape_text) < 100:
+                            if shape_text not in slide_header:  # Avoid duplicating slide number
+                                slide_title = shape_text
+                                break
+                except:
+                    pass
+                
+                # Add slide title if found
+                if slide_title:
+                    story.append(Paragraph(slide_title, content_title_style))
+                    story.append(Spacer(1, 12))
+                    slide_has_content = True
+                
+                # Sort shapes by their position (top to bottom, left to right)
+                # (placeholders that inherit their position report None and sort first)
+                sorted_entries = sorted(shape_entries, key=lambda entry: (entry[0].top or 0, entry[0].left or 0))
+                
+                for shape, shape_text in sorted_entries:
+                    # Skip if this is the title we already processed
+                    if slide_title and shape_text == slide_title:
+                        continue
+                        
+                    shape_count += 1
+                    if shape_count > max_shapes_per_slide:
+                        break
+                    
+                    try:
+                        # Handle images with improved quality
+                        if isinstance(shape, Picture):
                             try:
-                                pil_image = pil_image.resize((width, height), Image.Resampling.LANCZOS)
-                            except:
-                                # Fallback to BICUBIC if LANCZOS fails
-                                pil_image = pil_image.resize((width, height), Image.BICUBIC)
+                                # Decode/resize/encode on the picture pool; the Future holds the
+                                # picture's place in the story until the slides are all walked
+                                story.append(picture_executor.submit(slide_picture_flowables, shape.image.blob,
+                                                                     picture_max_width, picture_max_height))
+                            except Exception as img_error:
+                                # If image extraction fails, add a placeholder
+                                story.append(Paragraph("[Image could not be extracted]", content_style))
+                                story.append(Spacer(1, 8))
+                            slide_has_content = True
+                        
+                        # Handle text content with improved formatting
+                        elif shape_text:
+                            text = shape_text
+                            if len(text) > 2000:  # Increased text limit
+                                text = text[:2000] + "..."
                             
-                            # Convert to RGB if necessary
-                            if pil_image.mode in ('RGBA', 'LA', 'P'):
-                                pil_image = pil_image.convert('RGB')
+                            # Escape special characters for ReportLab
+                            text = escape(text)
                             
-                            # Save to BytesIO with higher quality
-                            img_buffer = io.BytesIO()
-                            pil_image.save(img_buffer, format='JPEG', quality=95)
-                            img_buffer.seek(0)
+                            # Determine text type and apply appropriate styling
+                            if len(text) < 100 and '\n' not in text:
+                                # Likely a title or header
+                                current_style = content_title_style
+                            elif text[0] in SLIDE_BULLET_CHARS:
+                                # Bullet point
+                                current_style = bullet_style
+                                text = text[1:].strip()  # Remove bullet character
+                            else:
+                                current_style = content_style
                             
-                            # Create ReportLab image with proper alignment and preserve formatting
-                            rl_image = RLImage(img_buffer, width=width, height=height)
-                            # Center the image for better formatting
-                            rl_image.hAlign = 'CENTER'
-                            story.append(rl_image)
-                            story.append(Spacer(1, 16))
-                            slide_has_content = True
+                            # Handle multi-line text better
+                            paragraphs = text.split('\n')
+                            for para in paragraphs:
+                                if para.strip():
+                                    story.append(Paragraph(para.strip(), current_style))
+                                    story.append(Spacer(1, 4))
                             
-                        except Exception as img_error:
-                            # If image extraction fails, add a placeholder
-                            story.append(Paragraph("[Image could not be extracted]", content_style))
                             story.append(Spacer(1, 8))
                             slide_has_content = True
-                    
-                    # Handle text content with improved formatting
-                    elif hasattr(shape, 'text') and shape.text.strip():
-                        text = shape.text.strip()
-                        if len(text) > 2000:  # Increased text limit
-                            text = text[:2000] + "..."
-                        
-                        # Escape special characters for ReportLab
-                        text = text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-                        
-                        # Determine text type and apply appropriate styling
-                        if len(text) < 100 and '\n' not in text:
-                            # Likely a title or header
-                            current_style = content_title_style
-                        elif text.startswith(('•', '-', '*', '◦', '▪', '▫')):
-                            # Bullet point
-                            current_style = bullet_style
-                            text = text[1:].strip()  # Remove bullet character
-                        else:
-                            current_style = content_style
                         
-                        # Handle multi-line text better
-                        paragraphs = text.split('\n')
-                        for para in paragraphs:
-                            if para.strip():
-                                story.append(Paragraph(para.strip(), current_style))
-                                story.append(Spacer(1, 4))
-                        
-                        story.append(Spacer(1, 8))
-                        slide_has_content = True
-                    
-                    # Enhanced text frame processing with better formatting
-                    elif hasattr(shape, 'text_frame') and shape.text_frame:
-                        text_frame = shape.text_frame
-                        if hasattr(text_frame, 'paragraphs'):
+                        # Enhanced text frame processing with better formatting
+                        elif shape.has_text_frame:
+                            text_frame = shape.text_frame
                             for paragraph in text_frame.paragraphs:
-                                if paragraph.text.strip():
-                                    para_text = paragraph.text.strip()
+                                para_text = paragraph.text.strip()
+                                if para_text:
                                     if len(para_text) > 1500:
                                         para_text = para_text[:1500] + "..."
                                     
                                     # Escape special characters for ReportLab
-                                    para_text = para_text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+                                    para_text = escape(para_text)
                                     
                                     # Enhanced bullet detection and formatting
                                     level = getattr(paragraph, 'level', 0)
                                     
-                                    if (para_text.startswith(('•', '-', '*', '◦', '▪', '▫')) or level > 0):
-                                        # Create custom bullet style based on level
-                                        level_style = ParagraphStyle(
-                                            f'BulletLevel{level}',
-                                            parent=bullet_style,
-                                            leftIndent=30 + (level * 15),
-                                            bulletIndent=15 + (level * 15)
-                                        )
-                                        current_style = level_style
+                                    typed_bullet = para_text[0] in SLIDE_BULLET_CHARS
+                                    
+                                    if typed_bullet or level > 0:
+                                        current_style = SLIDE_BULLET_LEVEL_STYLES[min(level, 8)]
                                         
-                                        if para_text.startswith(('•', '-', '*', '◦', '▪', '▫')):
+                                        if typed_bullet:
                                             para_text = para_text[1:].strip()
                                     elif len(para_text) < 100 and '\n' not in para_text:
                                         current_style = content_title_style
@@ -1055,67 +1244,62 @@ def ppt_to_pdf(uploaded_file):
                                     story.append(Paragraph(para_text, current_style))
                                     story.append(Spacer(1, 4))
                                     slide_has_content = True
-                    
-                    # Enhanced table handling with better formatting
-                    elif hasattr(shape, 'table'):
-                        table = shape.table
-                        table_data = []
                         
-                        # Process table data with better formatting
-                        for row_idx, row in enumerate(table.rows):
-                            row_data = []
-                            for cell in row.cells:
-                                cell_text = cell.text.strip() if cell.text else ""
-                                if len(cell_text) > 200:  # Increased cell text limit
-                                    cell_text = cell_text[:200] + "..."
-                                
-                                # Escape special characters for ReportLab
-                                cell_text = cell_text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-                                row_data.append(cell_text)
+                        # Enhanced table handling with better formatting
+                        elif shape.has_table:
+                            table = shape.table
+                            table_data = []
                             
-                            table_data.append(row_data)
-                        
-                        if table_data and any(any(cell for cell in row) for row in table_data):
-                            # Calculate better column widths
-                            col_count = len(table_data[0]) if table_data else 0
-                            if col_count > 0:
-                                available_width = pdf_doc.width * 0.9  # 90% of page width
-                                col_widths = [available_width / col_count] * col_count
+                            # Process table data with better formatting
+                            for row_idx, row in enumerate(table.rows):
+                                row_data = []
+                                for cell in row.cells:
+                                    cell_text = cell.text.strip() if cell.text else ""
+                                    if len(cell_text) > 200:  # Increased cell text limit
+                                        cell_text = cell_text[:200] + "..."
+                                    
+                                    # Escape special characters for ReportLab
+                                    cell_text = escape(cell_text)
+                                    row_data.append(cell_text)
                                 
-                                # Create enhanced ReportLab table with better styling
-                                t = Table(table_data, repeatRows=1, colWidths=col_widths)
-                                t.setStyle(TableStyle([
-                                    ('BACKGROUND', (0, 0), (-1, 0), colors.lightblue),
-                                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
-                                    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                                    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                                    ('FONTSIZE', (0, 0), (-1, -1), 10),  # Increased font size
-                                    ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                                    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                                    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
-                                    ('LEFTPADDING', (0, 0), (-1, -1), 6),
-                                    ('RIGHTPADDING', (0, 0), (-1, -1), 6),
-                                    ('TOPPADDING', (0, 0), (-1, -1), 4),
-                                    ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-                                ]))
-                                story.append(t)
-                                story.append(Spacer(1, 16))
-                                slide_has_content = True
+                                table_data.append(row_data)
+                            
+                            if table_data and any(any(cell for cell in row) for row in table_data):
+                                # Calculate better column widths
+                                col_count = len(table_data[0]) if table_data else 0
+                                if col_count > 0:
+                                    available_width = pdf_doc.width * 0.9  # 90% of page width
+                                    col_widths = [available_width / col_count] * col_count
+                                    
+                                    # Create enhanced ReportLab table with better styling
+                                    t = Table(table_data, repeatRows=1, colWidths=col_widths)
+                                    t.setStyle(SLIDE_TABLE_STYLE)
+                                    story.append(t)
+                                    story.append(Spacer(1, 16))
+                                    slide_has_content = True
+                    
+                    except Exception as shape_error:
+                        # Skip problematic shapes but continue processing
+                        continue
                 
-                except Exception as shape_error:
-                    # Skip problematic shapes but continue processing
-                    continue
-            
-            # Add content if slide was empty
-            if not slide_has_content:
-                story.append(Paragraph("(Empty slide or content could not be extracted)", content_style))
-                story.append(Spacer(1, 12))
+                # Add content if slide was empty
+                if not slide_has_content:
+                    story.append(Paragraph("(Empty slide or content could not be extracted)", content_style))
+                    story.append(Spacer(1, 12))
+                
+                # Add separator between slides (except for last slide)
+                if i < slide_count - 1:
+                    story.append(Spacer(1, 20))
+                    story.append(PageBreak())
             
-            # Add separator between slides (except for last slide)
-            if i < len(slides_to_process) - 1:
-                story.append(Spacer(1, 20))
-                story.append(PageBreak())
+            # Swap each picture Future for its flowables, in story order
+            resolved_story = []
+            for item in story:
+                if isinstance(item, Future):
+                    resolved_story.extend(item.result())
+                else:
+                    resolved_story.append(item)
+            story = resolved_story
         
         # Safety check: limit total story elements
         if len(story) > 500:  # Increased limit for better content
@@ -1156,9 +1340,10 @@ def ppt_to_pdf(uploaded_file):
                 slide_title = None
                 try:
                     for shape in slide.shapes:
-                        if hasattr(shape, 'is_placeholder') and shape.is_placeholder and shape.placeholder_format.idx == 0:
-                            if hasattr(shape, 'text') and shape.text.strip():
-                                slide_title = shape.text.strip()
+                        if shape.is_placeholder and shape.placeholder_format.idx == 0:
+                            shape_text = getattr(shape, 'text', '').strip()
+                            if shape_text:
+                                slide_title = shape_text
                                 break
                 except:
                     pass
@@ -1171,15 +1356,17 @@ def ppt_to_pdf(uploaded_file):
                 # Process shapes with better formatting
                 for shape in slide.shapes:
                     try:
+                        shape_text = getattr(shape, 'text', '').strip()
+
                         # Skip if this is the title we already processed
-                        if slide_title and hasattr(shape, 'text') and shape.text.strip() == slide_title:
+                        if slide_title and shape_text == slide_title:
                             continue
                             
-                        if hasattr(shape, 'text') and shape.text.strip():
-                            text = shape.text.strip()[:1000]  # Increased text length
+                        if shape_text:
+                            text = shape_text[:1000]  # Increased text length
                             
                             # Escape special characters for ReportLab
-                            text = text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+                            text = escape(text)
                             
                             # Handle multi-line text better
                             paragraphs = text.split('\n')
@@ -1189,7 +1376,7 @@ def ppt_to_pdf(uploaded_file):
                                     simple_story.append(Spacer(1, 4))
                             
                             simple_story.append(Spacer(1, 8))
-                        elif hasattr(shape, 'shape_type') and shape.shape_type == 13:
+                        elif isinstance(shape, Picture):
                             simple_story.append(Paragraph("[Image present but not extracted in simplified mode]", styles['Normal']))
                             simple_story.append(Spacer(1, 6))
                     except:
@@ -1198,7 +1385,7 @@ def ppt_to_pdf(uploaded_file):
                 simple_story.append(Spacer(1, 16))
                 
                 # Add page break between slides
-                if i < len(slides_to_process[:20]) - 1:
+                if i < min(slide_count, 20) - 1:
                     simple_story.append(PageBreak())
             
             # Build simple version
@@ -1210,12 +1397,25 @@ def ppt_to_pdf(uploaded_file):
         st.error(f"PowerPoint conversion error: {str(e)}")
         return None
 
+@cache_conversion
 def image_to_pdf(uploaded_file):
     """Convert Image to PDF"""
     try:
+        image_data = uploaded_file.getvalue()
+        
+        # img2pdf embeds JPEG data as-is and PNG data losslessly, so skip the PIL
+        # decode/re-encode for those uploads (it rejects PNGs with alpha, which fall through)
+        if image_data[:3] == b'\xff\xd8\xff' or image_data[:8] == b'\x89PNG\r\n\x1a\n':
+            try:
+                output = io.BytesIO(img2pdf.convert(image_data))
+                return output
+            except Exception as e:
+                logger.warning(f"Direct image embedding failed, re-encoding: {e}")
+        
         img = Image.open(uploaded_file)
         
-        if img.mode == 'RGBA':
+        # JPEG can only hold L/RGB/CMYK; palette and alpha images need converting first
+        if img.mode not in ('L', 'RGB', 'CMYK'):
             img = img.convert('RGB')
         
         output = io.BytesIO()
@@ -1231,17 +1431,21 @@ def image_to_pdf(uploaded_file):
         st.error(f"Error: {str(e)}")
         return None
 
+@cache_conversion
 def text_to_pdf(text_content):
     """Convert Text to PDF"""
     try:
         output = io.BytesIO()
         pdf_doc = SimpleDocTemplate(output, pagesize=letter)
-        styles = getSampleStyleSheet()
+        styles = STYLES
         story = []
         
-        for line in text_content.split('\n'):
-            if line.strip():
-                story.append(Paragraph(line, styles['Normal']))
+        # One Paragraph per block of consecutive lines instead of one per line
+        for has_text, lines in groupby(text_content.split('\n'), key=lambda line: bool(line.strip())):
+            if has_text:
+                # A long block is split so ReportLab never re-wraps one huge Paragraph at each page break
+                while chunk := list(islice(lines, TEXT_PARAGRAPH_MAX_LINES)):
+                    story.append(Paragraph('<br/>'.join(escape(line) for line in chunk), styles['Normal']))
                 story.append(Spacer(1, 12))
         
         pdf_doc.build(story)
@@ -1251,6 +1455,7 @@ def text_to_pdf(text_content):
         st.error(f"Error: {str(e)}")
         return None
 
+@cache_conversion
 @handle_conversion_errors
 def pdf_to_word(uploaded_file):
     """Convert PDF to Word using PyMuPDF for better text extraction"""
@@ -1259,7 +1464,7 @@ def pdf_to_word(uploaded_file):
     
     try:
         # Read PDF with PyMuPDF
-        pdf_document = fitz.open(stream=uploaded_file.read(), filetype="pdf")
+        pdf_document = fitz.open(stream=uploaded_file.getvalue(), filetype="pdf")
         doc = Document()
         
         # Add document title
@@ -1268,18 +1473,16 @@ def pdf_to_word(uploaded_file):
         for page_num in range(len(pdf_document)):
             page = pdf_document.load_page(page_num)
             
-            # Extract text with better formatting
-            text = page.get_text("text")
+            # Extract text already segmented into paragraph blocks by MuPDF
+            paragraphs = [block[4].strip() for block in page.get_text("blocks")
+                          if block[6] == 0 and block[4].strip()]  # Text blocks only
             
-            if text.strip():
+            if paragraphs:
                 # Add page header
                 doc.add_heading(f'Page {page_num + 1}', level=1)
                 
-                # Split text into paragraphs
-                paragraphs = text.split('\n\n')
                 for para in paragraphs:
-                    if para.strip():
-                        doc.add_paragraph(para.strip())
+                    doc.add_paragraph(para)
             
             # Extract images from page
             try:
@@ -1289,20 +1492,11 @@ def pdf_to_word(uploaded_file):
                     pix = fitz.Pixmap(pdf_document, xref)
                     
                     if pix.n - pix.alpha < 4:  # GRAY or RGB
-                        img_data = pix.tobytes("png")
-                        
-                        # Save image to temporary file
-                        with tempfile.NamedTemporaryFile(delete=False, suffix='.png') as tmp_file:
-                            tmp_file.write(img_data)
-                            tmp_file.flush()
-                            
-                            # Add image to document
-                            try:
-                                doc.add_picture(tmp_file.name, width=Inches(4))
-                            except:
-                                pass  # Skip if image can't be added
-                            finally:
-                                os.unlink(tmp_file.name)
+                        # python-docx reads the picture straight from memory
+                        try:
+                            doc.add_picture(io.BytesIO(pix.tobytes("png")), width=Inches(4))
+                        except:
+                            pass  # Skip if image can't be added
                     
                     pix = None  # Release memory
             except Exception as img_error:
@@ -1320,6 +1514,7 @@ def pdf_to_word(uploaded_file):
         logger.error(f"PDF to Word conversion error: {str(e)}")
         raise e
 
+@cache_conversion
 @handle_conversion_errors
 def pdf_to_excel(uploaded_file):
     """Convert PDF to Excel using PyMuPDF"""
@@ -1327,44 +1522,50 @@ def pdf_to_excel(uploaded_file):
         return None
     
     try:
-        pdf_document = fitz.open(stream=uploaded_file.read(), filetype="pdf")
-        all_data = []
+        pdf_document = fitz.open(stream=uploaded_file.getvalue(), filetype="pdf")
+        
+        # Write-only mode streams rows out instead of keeping a cell tree in memory
+        wb = openpyxl.Workbook(write_only=True)
+        ws = wb.create_sheet()
+        has_content = False
         
         for page_num in range(len(pdf_document)):
             page = pdf_document.load_page(page_num)
             
             # Try to extract tables first
             try:
-                tables = page.find_tables()
+                tables = page.find_tables().tables
                 if tables:
                     for table in tables:
                         table_data = table.extract()
                         for row in table_data:
-                            all_data.append([f"Page {page_num + 1} - Table"] + list(row))
-                        all_data.append([])  # Empty row between tables
+                            ws.append([f"Page {page_num + 1} - Table"] + list(row))
+                            has_content = True
+                        ws.append([])  # Empty row between tables
                 else:
                     # Extract text and split into rows
-                    text = page.get_text("text")
-                    lines = text.split('\n')
-                    for line in lines:
-                        if line.strip():
-                            all_data.append([f"Page {page_num + 1}", line.strip()])
+                    page_label = f"Page {page_num + 1}"
+                    for line in page.get_text("text").split('\n'):
+                        line = line.strip()
+                        if line:
+                            ws.append([page_label, line])
+                            has_content = True
             except:
                 # Fallback to text extraction
-                text = page.get_text("text")
-                lines = text.split('\n')
-                for line in lines:
-                    if line.strip():
-                        all_data.append([f"Page {page_num + 1}", line.strip()])
+                page_label = f"Page {page_num + 1}"
+                for line in page.get_text("text").split('\n'):
+                    line = line.strip()
+                    if line:
+                        ws.append([page_label, line])
+                        has_content = True
         
         pdf_document.close()
         
-        if not all_data:
-            all_data = [["No content found"]]
+        if not has_content:
+            ws.append(["No content found"])
         
-        df = pd.DataFrame(all_data)
         output = io.BytesIO()
-        df.to_excel(output, index=False, header=False, engine='openpyxl')
+        wb.save(output)
         output.seek(0)
         clear_memory()
         return output
@@ -1373,6 +1574,7 @@ def pdf_to_excel(uploaded_file):
         logger.error(f"PDF to Excel conversion error: {str(e)}")
         raise e
 
+@cache_conversion
 @handle_conversion_errors
 def pdf_to_text(uploaded_file):
     """Convert PDF to Text using PyMuPDF"""
@@ -1380,87 +1582,110 @@ def pdf_to_text(uploaded_file):
         return None
     
     try:
-        pdf_document = fitz.open(stream=uploaded_file.read(), filetype="pdf")
-        text_content = ""
+        pdf_document = fitz.open(stream=uploaded_file.getvalue(), filetype="pdf")
+        # Collect page sections and join once rather than growing one string per page
+        sections = []
         
         for page_num in range(len(pdf_document)):
             page = pdf_document.load_page(page_num)
             text = page.get_text("text")
             
             if text.strip():
-                text_content += f"\n--- Page {page_num + 1} ---\n"
-                text_content += text + "\n\n"
+                sections.append(f"\n--- Page {page_num + 1} ---\n{text}\n\n")
         
         pdf_document.close()
         clear_memory()
-        return text_content if text_content.strip() else "No text content found in PDF"
+        return "".join(sections) if sections else "No text content found in PDF"
         
     except Exception as e:
         logger.error(f"PDF to Text conversion error: {str(e)}")
         raise e
 
-def pdf_to_images(uploaded_file, format='JPEG'):
+def encode_image(img, format):
+    """Encode a PIL image in the given format, returned as a view of the encode buffer"""
+    img_byte_arr = io.BytesIO()
+    img.save(img_byte_arr, format=format)
+    return img_byte_arr.getbuffer()
+
+@cache_conversion
+def pdf_to_images(uploaded_file, format='JPEG', dpi=150):
     """Convert PDF pages to images using PyMuPDF"""
     try:
-        import fitz  # PyMuPDF
-        
-        pdf_document = fitz.open(stream=uploaded_file.read(), filetype="pdf")
-        
+        pdf_document = fitz.open(stream=uploaded_file.getvalue(), filetype="pdf")
+        page_count = min(len(pdf_document), 20)  # Limit to 20 pages
+        
+        # Pages are rendered on this thread (PyMuPDF documents are not thread-safe) and
+        # encoded in parallel; Pillow releases the GIL inside its codecs.
+        # ZipFile is not thread-safe, so entries are written from this thread in page order,
+        # and only a few decoded pages are kept alive at once instead of the whole document.
+        # JPEG data barely deflates, so it is stored as-is; PNG still gains a little at the fastest level.
+        compression = zipfile.ZIP_STORED if format == 'JPEG' else zipfile.ZIP_DEFLATED
+        max_workers = max(1, min(page_count, (os.cpu_count() or 2) - 1))
         zip_buffer = io.BytesIO()
-        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-            for page_num in range(min(len(pdf_document), 20)):  # Limit to 20 pages
+        with ThreadPoolExecutor(max_workers=max_workers) as executor, \
+                zipfile.ZipFile(zip_buffer, 'w', compression, compresslevel=1) as zip_file:
+            pending = deque()
+            
+            def write_next_page():
+                page_num, future = pending.popleft()
+                zip_file.writestr(f'page_{page_num+1}.{format.lower()}', future.result())
+            
+            for page_num in range(page_count):
                 page = pdf_document.load_page(page_num)
                 
-                # Convert page to image with good quality
-                pix = page.get_pixmap(matrix=fitz.Matrix(2.0, 2.0))
-                img_data = pix.tobytes("png")
-                
-                # Convert to PIL Image and then to desired format
-                img = Image.open(io.BytesIO(img_data))
-                if format == 'JPEG' and img.mode == 'RGBA':
-                    img = img.convert('RGB')
-                
-                img_byte_arr = io.BytesIO()
-                img.save(img_byte_arr, format=format)
-                img_byte_arr.seek(0)
-                zip_file.writestr(f'page_{page_num+1}.{format.lower()}', img_byte_arr.getvalue())
+                # Rasterize at the requested resolution (pixel count grows with dpi squared)
+                pix = page.get_pixmap(dpi=dpi, alpha=False)
                 
+                # Wrap the raw RGB samples directly instead of a PNG encode/decode round-trip;
+                # samples_mv is a view of the pixmap, so PIL makes the only copy
+                img = Image.frombytes("RGB", (pix.width, pix.height), pix.samples_mv)
                 pix = None  # Release memory
+                
+                pending.append((page_num, executor.submit(encode_image, img, format)))
+                while len(pending) > max_workers:
+                    write_next_page()
+            
+            while pending:
+                write_next_page()
         
         pdf_document.close()
+        
         zip_buffer.seek(0)
         return zip_buffer
     except Exception as e:
         st.error(f"Error: {str(e)}")
         return None
 
+@cache_conversion
 def merge_pdfs(uploaded_files):
     """Merge multiple PDFs using PyMuPDF"""
     try:
-        import fitz  # PyMuPDF
-        
         # Validate total file size
-        total_size = sum(len(file.getvalue()) for file in uploaded_files)
+        total_size = sum(file.size for file in uploaded_files)
         if total_size > 100 * 1024 * 1024:  # 100MB limit
             raise ValueError("Total file size too large. Please keep total size under 100MB.")
         
-        merged_pdf = fitz.open()
+        merged_pdf = None
         total_pages = 0
         
         for uploaded_file in uploaded_files:
-            # Reset file pointer
-            uploaded_file.seek(0)
-            
             # Read PDF
-            pdf_document = fitz.open(stream=uploaded_file.read(), filetype="pdf")
+            pdf_document = fitz.open(stream=uploaded_file.getvalue(), filetype="pdf")
             current_pages = len(pdf_document)
             
             # Check page limit
             total_pages += current_pages
             if total_pages > 500:  # Limit total pages
                 pdf_document.close()
+                if merged_pdf is not None:
+                    merged_pdf.close()
                 raise ValueError("Too many pages. Please keep total pages under 500.")
             
+            # The first PDF becomes the merge target, so its pages and metadata are kept without copying
+            if merged_pdf is None:
+                merged_pdf = pdf_document
+                continue
+            
             # Insert all pages from this PDF
             merged_pdf.insert_pdf(pdf_document)
             pdf_document.close()
@@ -1476,37 +1701,43 @@ def merge_pdfs(uploaded_files):
         st.error(f"Error: {str(e)}")
         return None
 
+def content_key(data):
+    """Short blake2b digest of file bytes, used as a cheap cache key"""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+@st.cache_data(show_spinner=False)
+def get_pdf_page_count(pdf_key, _pdf_bytes):
+    """Return the number of pages in a PDF, cached across reruns by content key"""
+    with fitz.open(stream=_pdf_bytes, filetype="pdf") as pdf_document:
+        return len(pdf_document)
+
+@cache_conversion
 def split_pdf(uploaded_file, split_at):
     """Split PDF at specific page using PyMuPDF"""
     try:
-        import fitz  # PyMuPDF
-        
-        pdf_document = fitz.open(stream=uploaded_file.read(), filetype="pdf")
+        pdf_document = fitz.open(stream=uploaded_file.getvalue(), filetype="pdf")
         total_pages = len(pdf_document)
         
+        # PDF content streams are mostly compressed already; use the fastest deflate level.
+        # Each part is serialized straight to bytes (a ZipFile member stream can't seek,
+        # which PyMuPDF's save needs).
         zip_buffer = io.BytesIO()
-        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zip_file:
             # Create first part (pages 0 to split_at-1)
             if split_at > 0:
                 pdf_part1 = fitz.open()
                 pdf_part1.insert_pdf(pdf_document, from_page=0, to_page=min(split_at-1, total_pages-1))
                 
-                output1 = io.BytesIO()
-                pdf_part1.save(output1)
+                zip_file.writestr('part1.pdf', pdf_part1.tobytes())
                 pdf_part1.close()
-                output1.seek(0)
-                zip_file.writestr('part1.pdf', output1.getvalue())
             
             # Create second part (pages split_at to end)
             if split_at < total_pages:
                 pdf_part2 = fitz.open()
                 pdf_part2.insert_pdf(pdf_document, from_page=split_at, to_page=total_pages-1)
                 
-                output2 = io.BytesIO()
-                pdf_part2.save(output2)
+                zip_file.writestr('part2.pdf', pdf_part2.tobytes())
                 pdf_part2.close()
-                output2.seek(0)
-                zip_file.writestr('part2.pdf', output2.getvalue())
         
         pdf_document.close()
         zip_buffer.seek(0)
@@ -1515,6 +1746,7 @@ def split_pdf(uploaded_file, split_at):
         st.error(f"Error: {str(e)}")
         return None
 
+@cache_conversion
 @handle_conversion_errors
 def compress_pdf(uploaded_file):
     """Compress PDF using PyMuPDF"""
@@ -1522,9 +1754,10 @@ def compress_pdf(uploaded_file):
         return None
     
     try:
-        pdf_document = fitz.open(stream=uploaded_file.read(), filetype="pdf")
+        pdf_document = fitz.open(stream=uploaded_file.getvalue(), filetype="pdf")
         
         # Compress by reducing image quality and removing unnecessary data
+        seen_xrefs = set()  # Images shared between pages are recompressed once
         for page_num in range(len(pdf_document)):
             page = pdf_document.load_page(page_num)
             
@@ -1532,20 +1765,30 @@ def compress_pdf(uploaded_file):
             image_list = page.get_images()
             for img_index, img in enumerate(image_list):
                 xref = img[0]
+                if xref in seen_xrefs:
+                    continue
+                seen_xrefs.add(xref)
                 pix = fitz.Pixmap(pdf_document, xref)
                 
                 if pix.n - pix.alpha < 4:  # GRAY or RGB
                     # Compress image
                     img_data = pix.tobytes("jpeg", jpg_quality=70)
                     
-                    # Replace image in PDF
-                    pdf_document.update_stream(xref, img_data)
+                    # Replace image in PDF, only when the JPEG is smaller than what is stored.
+                    # The stream is stored as-is and its dictionary updated to describe JPEG data.
+                    if len(img_data) < len(pdf_document.xref_stream_raw(xref)):
+                        pdf_document.update_stream(xref, img_data, compress=False)
+                        pdf_document.xref_set_key(xref, "Filter", "/DCTDecode")
+                        pdf_document.xref_set_key(xref, "DecodeParms", "null")
+                        pdf_document.xref_set_key(xref, "Decode", "null")
+                        pdf_document.xref_set_key(xref, "BitsPerComponent", "8")
+                        pdf_document.xref_set_key(xref, "ColorSpace", "/DeviceGray" if pix.n - pix.alpha == 1 else "/DeviceRGB")
                 
                 pix = None
         
-        # Save with compression
+        # Save with compression; object streams pack the remaining small objects together
         output = io.BytesIO()
-        pdf_document.save(output, garbage=4, deflate=True, clean=True)
+        pdf_document.save(output, garbage=4, deflate=True, clean=True, use_objstms=1)
         pdf_document.close()
         output.seek(0)
         clear_memory()
@@ -1555,6 +1798,7 @@ def compress_pdf(uploaded_file):
         logger.error(f"PDF compression error: {str(e)}")
         raise e
 
+@cache_conversion
 @handle_conversion_errors
 def rotate_pdf(uploaded_file, rotation):
     """Rotate PDF pages using PyMuPDF"""
@@ -1562,11 +1806,12 @@ def rotate_pdf(uploaded_file, rotation):
         return None
     
     try:
-        pdf_document = fitz.open(stream=uploaded_file.read(), filetype="pdf")
+        pdf_document = fitz.open(stream=uploaded_file.getvalue(), filetype="pdf")
         
-        for page_num in range(len(pdf_document)):
-            page = pdf_document.load_page(page_num)
-            page.set_rotation(rotation)
+        # Only each page's /Rotate entry changes; content streams are written back as-is.
+        # Add to the existing rotation so already-turned pages rotate relative to how they display.
+        for page in pdf_document:
+            page.set_rotation((page.rotation + rotation) % 360)
         
         output = io.BytesIO()
         pdf_document.save(output)
@@ -1579,6 +1824,7 @@ def rotate_pdf(uploaded_file, rotation):
         logger.error(f"PDF rotation error: {str(e)}")
         raise e
 
+@cache_conversion
 @handle_conversion_errors
 def remove_pdf_pages(uploaded_file, pages_to_remove):
     """Remove specific pages from PDF using PyMuPDF"""
@@ -1586,21 +1832,20 @@ def remove_pdf_pages(uploaded_file, pages_to_remove):
         return None
     
     try:
-        pdf_document = fitz.open(stream=uploaded_file.read(), filetype="pdf")
+        pdf_document = fitz.open(stream=uploaded_file.getvalue(), filetype="pdf")
         
-        # Convert to 0-based indexing and sort in reverse order
-        pages_to_remove = sorted([int(p) - 1 for p in pages_to_remove], reverse=True)
+        # Convert to 0-based indexing; a set so a repeated number removes its page only once
+        pages_to_remove = {int(p) - 1 for p in pages_to_remove}
         
-        # Remove pages (in reverse order to maintain indices)
-        for page_num in pages_to_remove:
-            if 0 <= page_num < len(pdf_document):
-                pdf_document.delete_page(page_num)
-        
-        if len(pdf_document) == 0:
+        # Keep everything else in one select() call instead of deleting page by page
+        pages_to_keep = [page_num for page_num in range(len(pdf_document)) if page_num not in pages_to_remove]
+        if not pages_to_keep:
             raise ValueError("Cannot remove all pages from PDF")
+        pdf_document.select(pages_to_keep)
         
         output = io.BytesIO()
-        pdf_document.save(output)
+        # garbage=1 drops the objects only the removed pages referenced
+        pdf_document.save(output, garbage=1)
         pdf_document.close()
         output.seek(0)
         clear_memory()
@@ -1610,6 +1855,7 @@ def remove_pdf_pages(uploaded_file, pages_to_remove):
         logger.error(f"PDF page removal error: {str(e)}")
         raise e
 
+@cache_conversion
 @handle_conversion_errors
 def extract_pdf_pages(uploaded_file, pages_to_extract):
     """Extract specific pages from PDF using PyMuPDF"""
@@ -1617,24 +1863,23 @@ def extract_pdf_pages(uploaded_file, pages_to_extract):
         return None
     
     try:
-        pdf_document = fitz.open(stream=uploaded_file.read(), filetype="pdf")
-        new_pdf = fitz.open()
+        pdf_document = fitz.open(stream=uploaded_file.getvalue(), filetype="pdf")
         
         # Convert to 0-based indexing
-        pages_to_extract = [int(p) - 1 for p in pages_to_extract]
+        pages_to_extract = sorted(int(p) - 1 for p in pages_to_extract)
+        pages_to_extract = [page_num for page_num in pages_to_extract if 0 <= page_num < len(pdf_document)]
         
-        # Extract pages
-        for page_num in sorted(pages_to_extract):
-            if 0 <= page_num < len(pdf_document):
-                new_pdf.insert_pdf(pdf_document, from_page=page_num, to_page=page_num)
-        
-        if new_pdf.page_count == 0:
+        if not pages_to_extract:
             raise ValueError("No valid pages found to extract")
         
+        # Narrow the opened copy down to the wanted pages in one select() call
+        # rather than copying them one at a time into a new document
+        pdf_document.select(pages_to_extract)
+        
         output = io.BytesIO()
-        new_pdf.save(output)
+        # garbage=1 drops every object the extracted pages no longer reference
+        pdf_document.save(output, garbage=1)
         pdf_document.close()
-        new_pdf.close()
         output.seek(0)
         clear_memory()
         return output
@@ -1643,35 +1888,97 @@ def extract_pdf_pages(uploaded_file, pages_to_extract):
         logger.error(f"PDF page extraction error: {str(e)}")
         raise e
 
-def convert_image_format(uploaded_file, output_format):
-    """Convert between image formats"""
-    try:
-        img = Image.open(uploaded_file)
-        
-        if output_format in ['JPEG', 'JPG'] and img.mode in ('RGBA', 'P'):
-            img = img.convert('RGB')
-        
-        output = io.BytesIO()
-        save_format = 'JPEG' if output_format == 'JPG' else output_format
-        img.save(output, format=save_format)
-        output.seek(0)
-        return output
-    except Exception as e:
-        st.error(f"Error: {str(e)}")
-        return None
-
-def resize_image(uploaded_file, width, height, maintain_aspect=True):
+@cache_image_conversion
+def convert_image_format(uploaded_file, output_format, webp_method=4):
+    """Convert between image formats; errors propagate to convert_images"""
+    img = Image.open(uploaded_file)
+    save_format = 'JPEG' if output_format == 'JPG' else output_format
+    
+    # Already in the target format: hand back the original bytes instead of a lossy re-encode
+    if img.format == save_format:
+        return io.BytesIO(uploaded_file.getvalue())
+    
+    if save_format == 'JPEG' and img.mode not in ('L', 'RGB', 'CMYK'):
+        img = img.convert('RGB')
+    
+    save_options = {}
+    if save_format == 'WEBP':
+        # method is libwebp's speed/size trade-off (0 fastest, 6 smallest).
+        # Palette and alpha images from lossless formats are graphics: keep them lossless.
+        save_options['method'] = webp_method
+        save_options['lossless'] = img.format in ('PNG', 'BMP', 'GIF') and img.mode in ('1', 'L', 'LA', 'P', 'PA', 'RGBA')
+    
+    output = io.BytesIO()
+    img.save(output, format=save_format, **save_options)
+    output.seek(0)
+    return output
+
+def convert_images(uploaded_files, output_format, webp_method=4):
+    """Convert several uploaded images in parallel, returning results in upload order"""
+    def convert(uploaded_file):
+        try:
+            return convert_image_format(uploaded_file, output_format, webp_method), None
+        except Exception as e:
+            return None, (uploaded_file.name, e)
+    
+    # Pillow releases the GIL inside its codecs, so threads give real parallelism.
+    # Workers get the script context for st.cache_data, but only report failures back:
+    # Streamlit elements are written from the script thread, in upload order.
+    with ThreadPoolExecutor(max_workers=min(len(uploaded_files), os.cpu_count() or 1),
+                            initializer=functools.partial(add_script_run_ctx, None, get_script_run_ctx())) as executor:
+        outcomes = list(executor.map(convert, uploaded_files))
+    
+    for _, error in outcomes:
+        if error:
+            name, e = error
+            st.error(f"Error converting {name}: {str(e)}")
+    return [result for result, _ in outcomes]
+
+def image_download_buttons(uploaded_files, results, ext, mime):
+    """Offer a single converted image directly, or several as one ZIP"""
+    converted = [(Path(f.name).stem, result) for f, result in zip(uploaded_files, results) if result]
+    if not converted:
+        return
+    st.success("✅ Conversion successful!")
+    if len(converted) == 1:
+        stem, result = converted[0]
+        st.download_button(f"📥 Download {ext.upper()}", result, f"{stem}.{ext}", mime)
+        return
+    
+    zip_buffer = io.BytesIO()
+    used_names = set()
+    # Images are already compressed, so store them as-is
+    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_STORED) as zip_file:
+        for stem, result in converted:
+            name, n = f"{stem}.{ext}", 1
+            while name in used_names:
+                n += 1
+                name = f"{stem}_{n}.{ext}"
+            used_names.add(name)
+            zip_file.writestr(name, result.getvalue())
+    zip_buffer.seek(0)
+    st.download_button(f"📥 Download {len(converted)} images (ZIP)", zip_buffer, f"converted_{ext}.zip", "application/zip")
+
+@cache_conversion
+def resize_image(uploaded_file, width, height, maintain_aspect=True, resample=Image.Resampling.LANCZOS):
     """Resize image"""
     try:
         img = Image.open(uploaded_file)
+        img_format = img.format or 'PNG'  # resize() returns an image without a format
         
+        # Let libjpeg decode at a reduced DCT scale (1/2, 1/4, 1/8) that still
+        # leaves at least twice the target size for the resampling filter
+        if img_format == 'JPEG':
+            img.draft(img.mode, (width * 2, height * 2))
+        
+        # reducing_gap box-reduces by an integer factor first, so the resampling filter
+        # only runs on an image about twice the target size (thumbnail already defaults to 2.0)
         if maintain_aspect:
-            img.thumbnail((width, height), Image.Resampling.LANCZOS)
+            img.thumbnail((width, height), resample, reducing_gap=2.0)
         else:
-            img = img.resize((width, height), Image.Resampling.LANCZOS)
+            img = img.resize((width, height), resample, reducing_gap=2.0)
         
         output = io.BytesIO()
-        img_format = img.format or 'PNG'
         if img_format == 'JPEG' and img.mode in ('RGBA', 'P'):
             img = img.convert('RGB')
         img.save(output, format=img_format)
@@ -1681,6 +1988,7 @@ def resize_image(uploaded_file, width, height, maintain_aspect=True):
         st.error(f"Error: {str(e)}")
         return None
 
+@cache_conversion
 def rotate_image(uploaded_file, angle):
     """Rotate image"""
     try:
@@ -1696,6 +2004,7 @@ def rotate_image(uploaded_file, angle):
         st.error(f"Error: {str(e)}")
         return None
 
+@cache_conversion
 def word_to_excel(uploaded_file):
     """Convert Word tables to Excel"""
     try:
@@ -1703,24 +2012,28 @@ def word_to_excel(uploaded_file):
         
         all_data = []
         for table in doc.tables:
-            for row in table.rows:
-                row_data = [cell.text for cell in row.cells]
-                all_data.append(row_data)
+            all_data.extend(docx_table_texts(table))
             all_data.append([])  # Empty row between tables
         
         if not all_data:
             st.warning("No tables found in document. Extracting text...")
             all_data = [[para.text] for para in doc.paragraphs if para.text.strip()]
         
-        df = pd.DataFrame(all_data)
+        # Rows are already in order, so stream them in constant-memory mode
+        # instead of padding them into a DataFrame first
         output = io.BytesIO()
-        df.to_excel(output, index=False, header=False, engine='openpyxl')
+        workbook = xlsxwriter.Workbook(output, {'constant_memory': True})
+        worksheet = workbook.add_worksheet()
+        for row_num, row in enumerate(all_data):
+            worksheet.write_row(row_num, 0, row)
+        workbook.close()
         output.seek(0)
         return output
     except Exception as e:
         st.error(f"Error: {str(e)}")
         return None
 
+@cache_conversion
 def excel_to_word(uploaded_file):
     """Convert Excel to Word"""
     try:
@@ -1729,15 +2042,27 @@ def excel_to_word(uploaded_file):
         
         doc.add_heading('Excel Data', 0)
         
-        table = doc.add_table(rows=len(df) + 1, cols=len(df.columns))
+        table = doc.add_table(rows=1, cols=len(df.columns))
         table.style = 'Light Grid Accent 1'
         
         for i, column in enumerate(df.columns):
             table.rows[0].cells[i].text = str(column)
         
-        for i, row in enumerate(df.itertuples(index=False), 1):
-            for j, value in enumerate(row):
-                table.rows[i].cells[j].text = str(value)
+        # Build the body rows as one XML fragment and parse it once; setting
+        # cell.text walks and rebuilds the python-docx tree for every value
+        cell_starts = [
+            f'<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="{tc.width.twips}"/></w:tcPr>'
+            f'<w:p><w:r><w:t xml:space="preserve">'
+            for tc in table._tbl.tr_lst[0].tc_lst
+        ]
+        rows_xml = ''.join(
+            '<w:tr>'
+            + ''.join(f'{start}{docx_run_text(str(value))}</w:t></w:r></w:p></w:tc>'
+                      for start, value in zip(cell_starts, row))
+            + '</w:tr>'
+            for row in df.itertuples(index=False, name=None)
+        )
+        table._tbl.extend(list(parse_xml(f'<w:tbl {nsdecls("w")}>{rows_xml}</w:tbl>')))
         
         output = io.BytesIO()
         doc.save(output)
@@ -1747,33 +2072,137 @@ def excel_to_word(uploaded_file):
         st.error(f"Error: {str(e)}")
         return None
 
+def arrow_table_to_xlsx(table):
+    """Write a pyarrow Table to an .xlsx buffer row by row in xlsxwriter's constant-memory mode"""
+    # xlsxwriter drops cells past the sheet limits instead of raising, so check up front
+    # (the header takes one row)
+    if table.num_rows + 1 > EXCEL_MAX_ROWS or table.num_columns > EXCEL_MAX_COLS:
+        raise ValueError(
+            f"This sheet is too large! Your sheet size is: {table.num_rows + 1}, {table.num_columns} "
+            f"Max sheet size is: {EXCEL_MAX_ROWS}, {EXCEL_MAX_COLS}"
+        )
+    
+    output = io.BytesIO()
+    # Rows are written strictly in order, which is what constant_memory requires
+    # (pandas' to_excel writes column by column and would lose cells in this mode)
+    workbook = xlsxwriter.Workbook(output, {
+        'constant_memory': True,
+        'default_date_format': 'yyyy-mm-dd hh:mm:ss',
+        'remove_timezone': True,
+        'nan_inf_to_errors': True,
+    })
+    worksheet = workbook.add_worksheet()
+    header_format = workbook.add_format({'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'})
+    worksheet.write_row(0, 0, table.column_names, header_format)
+    
+    row_num = 1
+    for batch in table.to_batches():
+        for row in zip(*(column.to_pylist() for column in batch.columns)):
+            worksheet.write_row(row_num, 0, row)
+            row_num += 1
+    
+    workbook.close()
+    output.seek(0)
+    return output
+
+@cache_conversion
+def csv_to_excel(uploaded_file):
+    """Convert CSV to Excel"""
+    try:
+        csv_bytes = uploaded_file.getvalue()
+        try:
+            # pyarrow parses large CSVs multi-threaded
+            table = pa_csv.read_csv(io.BytesIO(csv_bytes))
+            # Arrow infers dates, times and timestamps, which would then be written as Excel
+            # datetimes; re-read those columns as text so cells keep what the CSV said
+            temporal_columns = [field.name for field in table.schema if pa.types.is_temporal(field.type)]
+            if temporal_columns:
+                convert_options = pa_csv.ConvertOptions(column_types={name: pa.string() for name in temporal_columns})
+                table = pa_csv.read_csv(io.BytesIO(csv_bytes), convert_options=convert_options)
+        except Exception as e:
+            logger.warning(f"pyarrow CSV parse failed, using default parser: {e}")
+            df = pd.read_csv(io.BytesIO(csv_bytes))
+            output = io.BytesIO()
+            # xlsxwriter emits the sheet XML directly, much faster than openpyxl's cell objects
+            df.to_excel(output, index=False, engine='xlsxwriter')
+            output.seek(0)
+            return output
+        return arrow_table_to_xlsx(table)
+    except Exception as e:
+        st.error(f"Error: {str(e)}")
+        return None
+
+@cache_conversion
 def json_to_excel(json_data):
-    """Convert JSON to Excel"""
+    """Convert JSON (str or bytes) to Excel"""
     try:
-        data = json.loads(json_data)
-        
-        if isinstance(data, list):
-            df = pd.DataFrame(data)
-        elif isinstance(data, dict):
-            df = pd.DataFrame([data])
-        else:
+        try:
+            data = orjson.loads(json_data)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity and integers past 64 bits, which json accepts
+            data = json.loads(json_data)
+        
+        if isinstance(data, dict):
+            data = [data]
+        elif not isinstance(data, list):
             st.error("Invalid JSON format")
             return None
         
+        try:
+            # Arrow infers one column per key across all records, like pd.DataFrame does
+            table = pa.Table.from_struct_array(pa.array(data))
+        except Exception as e:
+            table = None
+            logger.info(f"JSON records not tabular for pyarrow, using pandas: {e}")
+        # Nested objects/arrays are left to pandas, which writes them as text
+        if table is not None and not any(pa.types.is_nested(field.type) for field in table.schema):
+            return arrow_table_to_xlsx(table)
+        
+        df = pd.DataFrame(data)
+        output = io.BytesIO()
+        df.to_excel(output, index=False, engine='xlsxwriter')
+        output.seek(0)
+        return output
+    except Exception as e:
+        st.error(f"Error: {str(e)}")
+        return None
+
+@cache_conversion
+def excel_to_csv(uploaded_file):
+    """Convert the first Excel sheet to CSV"""
+    try:
+        # calamine (Rust) parses the workbook several times faster than openpyxl
+        sheet = CalamineWorkbook.from_filelike(uploaded_file).get_sheet_by_index(0)
+        # Encode rows straight into the download buffer instead of building a str first
         output = io.BytesIO()
-        df.to_excel(output, index=False, engine='openpyxl')
+        text_stream = io.TextIOWrapper(output, encoding='utf-8', newline='')
+        writer = csv.writer(text_stream)
+        # iter_rows() starts at the first used column; pad rows so the data stays anchored at A1
+        leading_cells = [''] * sheet.start[1] if sheet.start else []
+        # calamine returns every number as a float; keep whole numbers as "1", not "1.0",
+        # but only where the float holds every digit exactly (1e20 stays "1e+20")
+        writer.writerows(
+            leading_cells + [int(value) if type(value) is float and value.is_integer() and abs(value) < 2**53 else value
+                             for value in row]
+            for row in sheet.iter_rows()
+        )
+        text_stream.detach()
         output.seek(0)
         return output
     except Exception as e:
         st.error(f"Error: {str(e)}")
         return None
 
+@cache_conversion
 def excel_to_json(uploaded_file):
     """Convert Excel to JSON"""
     try:
-        df = pd.read_excel(uploaded_file)
-        json_data = df.to_json(orient='records', indent=2)
-        return json_data
+        df = pd.read_excel(uploaded_file, engine='calamine')
+        # Write the encoded JSON straight into the download buffer
+        output = io.BytesIO()
+        df.to_json(output, orient='records', indent=2)
+        output.seek(0)
+        return output
     except Exception as e:
         st.error(f"Error: {str(e)}")
         return None
@@ -1887,10 +2316,12 @@ elif conversion_type == "PDF to Text":
 elif conversion_type in ["PDF to JPG", "PDF to PNG"]:
     format_type = conversion_type.split()[-1].upper()
     uploaded_file = st.file_uploader("Upload PDF", type=['pdf'])
+    dpi = st.select_slider("Resolution (DPI)", options=[72, 100, 150, 200, 300], value=150,
+                           help="Higher resolution gives sharper images but takes longer")
     if uploaded_file and st.button(f"Convert to {format_type}"):
         try:
             with st.spinner(f"Converting PDF to {format_type} images..."):
-                result = pdf_to_images(uploaded_file, format_type)
+                result = pdf_to_images(uploaded_file, format_type, dpi)
             if result:
                 st.success("✅ Conversion successful! Multiple images will be downloaded as ZIP")
                 st.download_button("📥 Download Images (ZIP)", result, f"{Path(uploaded_file.name).stem}_images.zip", "application/zip")
@@ -1929,10 +2360,8 @@ elif conversion_type == "Split PDF":
     uploaded_file = st.file_uploader("Upload PDF", type=['pdf'])
     if uploaded_file:
         try:
-            pdf_document = fitz.open(stream=uploaded_file.read(), filetype="pdf")
-            total_pages = len(pdf_document)
-            pdf_document.close()
-            uploaded_file.seek(0)  # Reset file pointer
+            pdf_bytes = uploaded_file.getvalue()
+            total_pages = get_pdf_page_count(content_key(pdf_bytes), pdf_bytes)
             st.info(f"📄 PDF has {total_pages} pages")
         except Exception as e:
             st.error(f"Error reading PDF: {str(e)}")
@@ -1954,7 +2383,7 @@ elif conversion_type == "Compress PDF":
             with st.spinner("Compressing PDF..."):
                 result = compress_pdf(uploaded_file)
             if result:
-                original_size = len(uploaded_file.getvalue())
+                original_size = uploaded_file.size
                 compressed_size = len(result.getvalue())
                 reduction = ((original_size - compressed_size) / original_size) * 100
                 
@@ -1983,22 +2412,29 @@ elif conversion_type == "Remove PDF Pages":
     uploaded_file = st.file_uploader("Upload PDF", type=['pdf'])
     if uploaded_file:
         try:
-            pdf_document = fitz.open(stream=uploaded_file.read(), filetype="pdf")
-            total_pages = len(pdf_document)
-            pdf_document.close()
-            uploaded_file.seek(0)  # Reset file pointer
+            pdf_bytes = uploaded_file.getvalue()
+            total_pages = get_pdf_page_count(content_key(pdf_bytes), pdf_bytes)
             st.info(f"📄 PDF has {total_pages} pages")
             
             pages_input = st.text_input("Enter page numbers to remove (comma-separated, e.g., 1,3,5)")
             
             if st.button("Remove Pages"):
                 try:
-                    pages_to_remove = [int(p.strip()) for p in pages_input.split(',') if p.strip()]
-                    with st.spinner("Removing pages..."):
-                        result = remove_pdf_pages(uploaded_file, pages_to_remove)
-                        if result:
-                            st.success(f"✅ Removed {len(pages_to_remove)} pages successfully!")
-                            st.download_button("📥 Download PDF", result, f"{Path(uploaded_file.name).stem}_modified.pdf", "application/pdf")
+                    # Parse, dedupe and bounds-check once; the sorted list also gives
+                    # "3,1" and "1,3,3" the same cache entry as "1,3"
+                    requested_pages = {int(p) for p in pages_input.split(',') if p.strip()}
+                    out_of_range = sorted(p for p in requested_pages if not 1 <= p <= total_pages)
+                    if out_of_range:
+                        st.warning(f"⚠️ Ignoring pages not in this PDF: {', '.join(map(str, out_of_range))}")
+                    pages_to_remove = sorted(requested_pages.difference(out_of_range))
+                    if not pages_to_remove:
+                        st.error("Please enter valid page numbers")
+                    else:
+                        with st.spinner("Removing pages..."):
+                            result = remove_pdf_pages(uploaded_file, pages_to_remove)
+                            if result:
+                                st.success(f"✅ Removed {len(pages_to_remove)} pages successfully!")
+                                st.download_button("📥 Download PDF", result, f"{Path(uploaded_file.name).stem}_modified.pdf", "application/pdf")
                 except ValueError:
                     st.error("Please enter valid page numbers")
         except Exception as e:
@@ -2008,10 +2444,8 @@ elif conversion_type == "Extract PDF Pages":
     uploaded_file = st.file_uploader("Upload PDF", type=['pdf'])
     if uploaded_file:
         try:
-            pdf_document = fitz.open(stream=uploaded_file.read(), filetype="pdf")
-            total_pages = len(pdf_document)
-            pdf_document.close()
-            uploaded_file.seek(0)  # Reset file pointer
+            pdf_bytes = uploaded_file.getvalue()
+            total_pages = get_pdf_page_count(content_key(pdf_bytes), pdf_bytes)
             st.info(f"📄 PDF has {total_pages} pages")
             
             pages_input = st.text_input("Enter page numbers to extract (comma-separated, e.g., 1,3,5)")
@@ -2033,81 +2467,78 @@ elif conversion_type in ["JPG to PNG", "PNG to JPG"]:
     input_format = conversion_type.split()[0].lower()
     output_format = conversion_type.split()[-1].upper()
     
-    uploaded_file = st.file_uploader(f"Upload {input_format.upper()} Image", type=[input_format, 'jpeg'])
-    if uploaded_file and st.button(f"Convert to {output_format}"):
+    uploaded_files = st.file_uploader(f"Upload {input_format.upper()} Images", type=[input_format, 'jpeg'], accept_multiple_files=True)
+    if uploaded_files and st.button(f"Convert to {output_format}"):
         with st.spinner("Converting..."):
-            result = convert_image_format(uploaded_file, output_format)
-            if result:
-                st.success("✅ Conversion successful!")
-                ext = output_format.lower()
-                st.download_button("📥 Download Image", result, f"{Path(uploaded_file.name).stem}.{ext}", f"image/{ext}")
+            results = convert_images(uploaded_files, output_format)
+        ext = output_format.lower()
+        image_download_buttons(uploaded_files, results, ext, f"image/{'jpeg' if ext == 'jpg' else ext}")
 
 elif conversion_type == "Image to WebP":
-    uploaded_file = st.file_uploader("Upload Image", type=['jpg', 'jpeg', 'png', 'bmp'])
-    if uploaded_file and st.button("Convert to WebP"):
+    uploaded_files = st.file_uploader("Upload Images", type=['jpg', 'jpeg', 'png', 'bmp'], accept_multiple_files=True)
+    effort = st.slider("WebP effort", 0, 6, 4,
+                       help="Higher effort gives smaller files but takes longer to encode")
+    if uploaded_files and st.button("Convert to WebP"):
         with st.spinner("Converting..."):
-            result = convert_image_format(uploaded_file, 'WEBP')
-            if result:
-                st.success("✅ Conversion successful!")
-                st.download_button("📥 Download WebP", result, f"{Path(uploaded_file.name).stem}.webp", "image/webp")
+            results = convert_images(uploaded_files, 'WEBP', effort)
+        image_download_buttons(uploaded_files, results, 'webp', "image/webp")
 
 elif conversion_type == "WebP to JPG":
-    uploaded_file = st.file_uploader("Upload WebP Image", type=['webp'])
-    if uploaded_file and st.button("Convert to JPG"):
+    uploaded_files = st.file_uploader("Upload WebP Images", type=['webp'], accept_multiple_files=True)
+    if uploaded_files and st.button("Convert to JPG"):
         with st.spinner("Converting..."):
-            result = convert_image_format(uploaded_file, 'JPEG')
-            if result:
-                st.success("✅ Conversion successful!")
-                st.download_button("📥 Download JPG", result, f"{Path(uploaded_file.name).stem}.jpg", "image/jpeg")
+            results = convert_images(uploaded_files, 'JPEG')
+        image_download_buttons(uploaded_files, results, 'jpg', "image/jpeg")
 
 elif conversion_type == "WebP to PNG":
-    uploaded_file = st.file_uploader("Upload WebP Image", type=['webp'])
-    if uploaded_file and st.button("Convert to PNG"):
+    uploaded_files = st.file_uploader("Upload WebP Images", type=['webp'], accept_multiple_files=True)
+    if uploaded_files and st.button("Convert to PNG"):
         with st.spinner("Converting..."):
-            result = convert_image_format(uploaded_file, 'PNG')
-            if result:
-                st.success("✅ Conversion successful!")
-                st.download_button("📥 Download PNG", result, f"{Path(uploaded_file.name).stem}.png", "image/png")
+            results = convert_images(uploaded_files, 'PNG')
+        image_download_buttons(uploaded_files, results, 'png', "image/png")
 
 elif conversion_type == "Image to BMP":
-    uploaded_file = st.file_uploader("Upload Image", type=['jpg', 'jpeg', 'png', 'webp'])
-    if uploaded_file and st.button("Convert to BMP"):
+    uploaded_files = st.file_uploader("Upload Images", type=['jpg', 'jpeg', 'png', 'webp'], accept_multiple_files=True)
+    if uploaded_files and st.button("Convert to BMP"):
         with st.spinner("Converting..."):
-            result = convert_image_format(uploaded_file, 'BMP')
-            if result:
-                st.success("✅ Conversion successful!")
-                st.download_button("📥 Download BMP", result, f"{Path(uploaded_file.name).stem}.bmp", "image/bmp")
+            results = convert_images(uploaded_files, 'BMP')
+        image_download_buttons(uploaded_files, results, 'bmp', "image/bmp")
 
 elif conversion_type == "BMP to JPG":
-    uploaded_file = st.file_uploader("Upload BMP Image", type=['bmp'])
-    if uploaded_file and st.button("Convert to JPG"):
+    uploaded_files = st.file_uploader("Upload BMP Images", type=['bmp'], accept_multiple_files=True)
+    if uploaded_files and st.button("Convert to JPG"):
         with st.spinner("Converting..."):
-            result = convert_image_format(uploaded_file, 'JPEG')
-            if result:
-                st.success("✅ Conversion successful!")
-                st.download_button("📥 Download JPG", result, f"{Path(uploaded_file.name).stem}.jpg", "image/jpeg")
+            results = convert_images(uploaded_files, 'JPEG')
+        image_download_buttons(uploaded_files, results, 'jpg', "image/jpeg")
 
 elif conversion_type == "Resize Image":
     uploaded_file = st.file_uploader("Upload Image", type=['jpg', 'jpeg', 'png', 'webp', 'bmp'])
     if uploaded_file:
         img = Image.open(uploaded_file)
-        st.image(img, caption=f"Original: {img.size[0]}x{img.size[1]} pixels", use_container_width=True)
+        orig_width, orig_height = img.size
+        # Decode JPEG previews at a reduced DCT scale; resize_image reopens the upload at full size
+        img.draft(img.mode, PREVIEW_DRAFT_SIZE)
+        st.image(img, caption=f"Original: {orig_width}x{orig_height} pixels", use_container_width=True)
         
         col1, col2 = st.columns(2)
         with col1:
-            width = st.number_input("Width (pixels)", min_value=1, value=img.size[0])
+            width = st.number_input("Width (pixels)", min_value=1, value=orig_width)
         with col2:
-            height = st.number_input("Height (pixels)", min_value=1, value=img.size[1])
+            height = st.number_input("Height (pixels)", min_value=1, value=orig_height)
         
         maintain_aspect = st.checkbox("Maintain aspect ratio", value=True)
+        resample_name = st.selectbox("Resampling filter", tuple(RESAMPLING_FILTERS),
+                                     help="Lanczos is sharpest; Bilinear is fastest on large images")
         
         if st.button("Resize Image"):
             with st.spinner("Resizing..."):
-                result = resize_image(uploaded_file, width, height, maintain_aspect)
+                result = resize_image(uploaded_file, width, height, maintain_aspect, RESAMPLING_FILTERS[resample_name])
                 if result:
                     st.success("✅ Image resized successfully!")
-                    resized_img = Image.open(result)
-                    st.image(resized_img, caption=f"Resized: {resized_img.size[0]}x{resized_img.size[1]} pixels")
+                    # Image.open only parses the header here; st.image sends the encoded
+                    # bytes as they are instead of re-encoding a decoded copy
+                    resized_width, resized_height = Image.open(result).size
+                    st.image(result, caption=f"Resized: {resized_width}x{resized_height} pixels")
                     result.seek(0)
                     ext = Path(uploaded_file.name).suffix
                     st.download_button("📥 Download Resized Image", result, f"{Path(uploaded_file.name).stem}_resized{ext}", f"image/{ext[1:]}")
@@ -2116,6 +2547,7 @@ elif conversion_type == "Rotate Image":
     uploaded_file = st.file_uploader("Upload Image", type=['jpg', 'jpeg', 'png', 'webp', 'bmp'])
     if uploaded_file:
         img = Image.open(uploaded_file)
+        img.draft(img.mode, PREVIEW_DRAFT_SIZE)
         st.image(img, caption="Original Image", use_container_width=True)
         
         angle = st.selectbox("Select rotation angle", [90, 180, 270, -90, -180, -270])
@@ -2125,8 +2557,7 @@ elif conversion_type == "Rotate Image":
                 result = rotate_image(uploaded_file, angle)
                 if result:
                     st.success("✅ Image rotated successfully!")
-                    rotated_img = Image.open(result)
-                    st.image(rotated_img, caption=f"Rotated {angle}°")
+                    st.image(result, caption=f"Rotated {angle}°")
                     result.seek(0)
                     ext = Path(uploaded_file.name).suffix
                     st.download_button("📥 Download Rotated Image", result, f"{Path(uploaded_file.name).stem}_rotated{ext}", f"image/{ext[1:]}")
@@ -2155,22 +2586,20 @@ elif conversion_type == "CSV to Excel":
     uploaded_file = st.file_uploader("Upload CSV", type=['csv'])
     if uploaded_file and st.button("Convert to Excel"):
         with st.spinner("Converting..."):
-            df = pd.read_csv(uploaded_file)
-            output = io.BytesIO()
-            df.to_excel(output, index=False, engine='openpyxl')
-            output.seek(0)
-            st.success("✅ Conversion successful!")
-            st.download_button("📥 Download Excel", output, f"{Path(uploaded_file.name).stem}.xlsx",
-                             "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
+            result = csv_to_excel(uploaded_file)
+            if result:
+                st.success("✅ Conversion successful!")
+                st.download_button("📥 Download Excel", result, f"{Path(uploaded_file.name).stem}.xlsx",
+                                 "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
 
 elif conversion_type == "Excel to CSV":
     uploaded_file = st.file_uploader("Upload Excel", type=['xlsx', 'xls'])
     if uploaded_file and st.button("Convert to CSV"):
         with st.spinner("Converting..."):
-            df = pd.read_excel(uploaded_file)
-            csv_data = df.to_csv(index=False)
-            st.success("✅ Conversion successful!")
-            st.download_button("📥 Download CSV", csv_data, f"{Path(uploaded_file.name).stem}.csv", "text/csv")
+            csv_data = excel_to_csv(uploaded_file)
+            if csv_data:
+                st.success("✅ Conversion successful!")
+                st.download_button("📥 Download CSV", csv_data, f"{Path(uploaded_file.name).stem}.csv", "text/csv")
 
 elif conversion_type == "JSON to Excel":
     json_input = st.text_area("Paste JSON data", height=300)
@@ -2179,8 +2608,12 @@ elif conversion_type == "JSON to Excel":
     uploaded_file = st.file_uploader("Upload JSON file", type=['json'])
     
     if uploaded_file:
-        json_input = uploaded_file.read().decode('utf-8')
-        st.text_area("JSON Content", json_input, height=200)
+        # Raw bytes go straight to orjson; no utf-8 decode needed for conversion
+        json_input = uploaded_file.getvalue()
+        if len(json_input) > 256 * 1024:  # 256KB preview limit
+            st.caption(f"{len(json_input) // 1024} KB JSON loaded (preview skipped)")
+        else:
+            st.text_area("JSON Content", json_input.decode('utf-8', errors='replace'), height=200)
     
     if json_input and st.button("Convert to Excel"):
         with st.spinner("Converting..."):
@@ -2197,7 +2630,11 @@ elif conversion_type == "Excel to JSON":
             result = excel_to_json(uploaded_file)
             if result:
                 st.success("✅ Conversion successful!")
-                st.text_area("JSON Output", result, height=300)
+                json_bytes = result.getvalue()
+                if len(json_bytes) > 256 * 1024:  # 256KB preview limit
+                    st.caption(f"{len(json_bytes) // 1024} KB JSON generated (preview skipped)")
+                else:
+                    st.text_area("JSON Output", json_bytes.decode('utf-8'), height=300)
                 st.download_button("📥 Download JSON", result, f"{Path(uploaded_file.name).stem}.json", "application/json")
 
 # Footer
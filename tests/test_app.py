@@ -0,0 +1,139 @@
+"""Regression tests for the converters in app.py (run with `python -m pytest -q`)"""
+import importlib.util
+import io
+import re
+import threading
+import zipfile
+from pathlib import Path
+
+import fitz
+import openpyxl
+import pytest
+from PIL import Image
+from streamlit.runtime.uploaded_file_manager import UploadedFile, UploadedFileRec
+
+APP_PATH = Path(__file__).resolve().parent.parent / "app.py"
+
+
+@pytest.fixture(scope="module")
+def app():
+    """Load app.py as a module; Streamlit runs it in bare mode"""
+    spec = importlib.util.spec_from_file_location("app", APP_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def make_upload(data, name, mime=""):
+    """Wrap bytes in a real Streamlit UploadedFile"""
+    return UploadedFile(UploadedFileRec(file_id=name, name=name, type=mime, data=data), None)
+
+
+def xlsx_with_stale_dimension(rows):
+    """An .xlsx whose sheet claims <dimension ref="A1"/>, as some writers leave it"""
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    for row in rows:
+        ws.append(row)
+    source = io.BytesIO()
+    wb.save(source)
+
+    output = io.BytesIO()
+    with zipfile.ZipFile(source) as zin, zipfile.ZipFile(output, "w") as zout:
+        for item in zin.infolist():
+            data = zin.read(item.filename)
+            if item.filename == "xl/worksheets/sheet1.xml":
+                data = re.sub(rb'<dimension ref="[^"]*"/>', b'<dimension ref="A1"/>', data)
+            zout.writestr(item, data)
+    return output.getvalue()
+
+
+def pdf_words(pdf_buffer):
+    with fitz.open(stream=pdf_buffer.getvalue(), filetype="pdf") as pdf_document:
+        return [word for page in pdf_document for word in page.get_text().split()]
+
+
+def test_excel_to_pdf_ignores_stale_dimension(app):
+    upload = make_upload(xlsx_with_stale_dimension([["a", "b", "c"], [1, 2, 3]]), "stale.xlsx")
+
+    result = app.excel_to_pdf(upload)
+
+    words = pdf_words(result)
+    assert words[words.index("a"):] == ["a", "b", "c", "1", "2", "3"]
+
+
+def test_text_to_pdf_splits_long_blocks(app, monkeypatch):
+    lines = [f"line {n}" for n in range(4000)]
+    paragraphs = []
+    build = app.SimpleDocTemplate.build
+
+    def recording_build(doc, story, *args, **kwargs):
+        paragraphs.extend(f for f in story if isinstance(f, app.Paragraph))
+        return build(doc, story, *args, **kwargs)
+
+    monkeypatch.setattr(app.SimpleDocTemplate, "build", recording_build)
+
+    result = app.text_to_pdf("\n".join(lines))
+
+    assert len(paragraphs) == 4000 // app.TEXT_PARAGRAPH_MAX_LINES
+    assert pdf_words(result)[-2:] == ["line", "3999"]
+
+
+def test_csv_to_excel_keeps_date_text(app):
+    csv_data = b"day,stamp,amount\n2024-01-05,2024-01-05T10:00,1\n2024-02-29,2024-02-29 23:59:59,2\n"
+
+    result = app.csv_to_excel(make_upload(csv_data, "dates.csv", "text/csv"))
+
+    rows = list(openpyxl.load_workbook(result).active.values)
+    assert rows == [
+        ("day", "stamp", "amount"),
+        ("2024-01-05", "2024-01-05T10:00", 1),
+        ("2024-02-29", "2024-02-29 23:59:59", 2),
+    ]
+
+
+def test_arrow_table_to_xlsx_rejects_rows_past_sheet_limit(app, monkeypatch):
+    monkeypatch.setattr(app, "EXCEL_MAX_ROWS", 3)
+    table = app.pa.table({"n": [1, 2, 3]})
+
+    with pytest.raises(ValueError, match="too large"):
+        app.arrow_table_to_xlsx(table)
+
+
+def test_json_to_excel_accepts_what_json_accepts(app):
+    result = app.json_to_excel(b'[{"a": NaN, "b": 123456789012345678901234567890}]')
+
+    rows = list(openpyxl.load_workbook(result).active.values)
+    assert rows[0] == ("a", "b")
+    assert len(rows) == 2
+
+
+def test_excel_to_csv_keeps_offset_data_in_place(app):
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws["C3"], ws["D3"] = "h1", "h2"
+    ws["C4"], ws["D4"] = 1, 1e20
+    source = io.BytesIO()
+    wb.save(source)
+
+    result = app.excel_to_csv(make_upload(source.getvalue(), "offset.xlsx"))
+
+    assert result.getvalue().decode() == ",,,\r\n,,,\r\n,,h1,h2\r\n,,1,1e+20\r\n"
+
+
+def test_convert_images_reports_errors_from_script_thread(app, monkeypatch):
+    png = io.BytesIO()
+    Image.new("RGB", (8, 8), "red").save(png, format="PNG")
+    uploads = [make_upload(png.getvalue(), "ok.png", "image/png"),
+               make_upload(b"not an image", "broken.png", "image/png")]
+    errors = []
+    monkeypatch.setattr(app.st, "error", lambda message: errors.append((message, threading.current_thread())))
+
+    results = app.convert_images(uploads, "JPEG")
+
+    assert Image.open(results[0]).format == "JPEG"
+    assert results[1] is None
+    assert len(errors) == 1
+    message, thread = errors[0]
+    assert "broken.png" in message
+    assert thread is threading.main_thread()